@@ -232,7 +232,7 @@ class InitLevelModal(BaseModal):
             return
 
         suggested_levlels = await get_character_suggested_talent_levels(
-            self.character_id, i.client.session
+            self.character_id
         )
         view = View()
         view.author = i.user
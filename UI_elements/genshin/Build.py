@@ -1,10 +1,10 @@
-from typing import Dict, List, Optional
+from typing import List, Optional
 
-import yaml
 from discord import Embed, Interaction, SelectOption
 from discord.ui import Button, Select
 
 import config
+from apps.genshin.build_guides import get_build_guides
 from apps.genshin.utils import get_character_builds, get_character_emoji
 from apps.text_map.cond_text import cond_text
 from apps.text_map.text_map_app import text_map
@@ -35,17 +35,14 @@ class ElementButton(Button):
 
 
 class CharacterSelect(Select):
-    def __init__(
-        self, options: List[SelectOption], placeholder: str, builds: Dict, element: str
-    ):
+    def __init__(self, options: List[SelectOption], placeholder: str, element: str):
         super().__init__(options=options, placeholder=placeholder)
-        self.builds = builds
         self.element = element
 
     async def callback(self, i: Interaction):
         self.view: View
         locale = await get_user_locale(i.user.id, i.client.db) or i.locale
-        builds = get_character_builds(self.values[0], self.builds, locale)
+        builds = get_character_builds(self.values[0], self.element, locale)
         embeds = []
         options = []
         for index, build in enumerate(builds):
@@ -54,14 +51,11 @@ class CharacterSelect(Select):
                 options.append(
                     SelectOption(label=text_map.get(97, locale), value=str(index))
                 )
-            elif build.weapon is not None and build.artifact is not None:
-                weapon_id = text_map.get_id_from_name(build.weapon)
-                if weapon_id is None:
-                    raise ValueError(f"Could not find weapon {build.weapon}")
+            elif build.weapon_id is not None and build.artifact is not None:
                 options.append(
                     SelectOption(
                         label=f"{text_map.get(162, locale)} {index+1}",
-                        description=f"{text_map.get_weapon_name(weapon_id, locale)} | {cond_text.get_text(str(locale), 'build', build.artifact)}",
+                        description=f"{text_map.get_weapon_name(build.weapon_id, locale)} | {cond_text.get_text(str(locale), 'build', build.artifact)}",
                         value=str(index),
                     )
                 )
@@ -104,14 +98,12 @@ class GoBack(Button):
 
 
 async def element_button_callback(i: Interaction, element: str, view: View):
-    with open(f"data/builds/{element.lower()}.yaml", "r", encoding="utf-8") as f:
-        builds = yaml.full_load(f)
     user_locale = await get_user_locale(i.user.id, i.client.db)
     options = []
     placeholder = text_map.get(157, i.locale, user_locale)
     user_locale = await get_user_locale(i.user.id, i.client.db)
-    for character_name, character_builds in builds.items():
-        character_id = text_map.get_id_from_name(character_name)
+    for character_builds in get_build_guides().elements.get(element, {}).values():
+        character_id = character_builds.character_id
         localized_character_name = text_map.get_character_name(
             str(character_id), user_locale or i.locale
         )
@@ -122,11 +114,11 @@ async def element_button_callback(i: Interaction, element: str, view: View):
                 label=localized_character_name,
                 emoji=get_character_emoji(str(character_id)),
                 value=str(character_id),
-                description=f'{len(character_builds["builds"])} {text_map.get(164, i.locale, user_locale)}',
+                description=f"{len(character_builds.builds)} {text_map.get(164, i.locale, user_locale)}",
             )
         )
     view.clear_items()
-    view.add_item(CharacterSelect(options, placeholder, builds, element))
+    view.add_item(CharacterSelect(options, placeholder, element))
     view.add_item(GoBack("element"))
     await i.response.edit_message(embed=None, view=view)
     view.message = await i.original_response()
@@ -0,0 +1,77 @@
+"""Compare cold-load time and memory of the JSON and binary ambr caches.
+
+Usage (from the repository root):
+    python -m ambr.benchmark [lang]
+
+Binary files are created from the JSON files if they don't exist yet. Each
+measurement runs in a fresh interpreter so the numbers are for a cold load.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from ambr import binary_cache
+from ambr.endpoints import ENDPOINTS
+
+MEASURE = """
+import json, resource, sys, time
+from ambr import binary_cache
+from ambr.endpoints import ENDPOINTS
+lang, binary = sys.argv[1], sys.argv[2] == "1"
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+data = {}
+for endpoint, name in ENDPOINTS.items():
+    path = f"ambr/cache/{lang}/{name}." + ("bin" if binary else "json")
+    if binary:
+        data[endpoint] = binary_cache.load(path)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            data[endpoint] = json.load(f)
+load_time = time.perf_counter() - start
+start = time.perf_counter()
+items = data["material"]["data"]["items"]
+items[next(iter(items))]
+lookup_time = time.perf_counter() - start
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"load": load_time, "lookup": lookup_time, "rss_kb": after - before}))
+"""
+
+
+def ensure_binary_files(lang: str) -> None:
+    for name in ENDPOINTS.values():
+        json_path = f"ambr/cache/{lang}/{name}.json"
+        bin_path = f"ambr/cache/{lang}/{name}.bin"
+        if os.path.exists(bin_path):
+            continue
+        with open(json_path, "r", encoding="utf-8") as f:
+            binary_cache.write(bin_path, json.load(f))
+
+
+def measure(lang: str, binary: bool) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", MEASURE, lang, "1" if binary else "0"]
+    )
+    return json.loads(output)
+
+
+def main() -> None:
+    lang = sys.argv[1] if len(sys.argv) > 1 else "en"
+    ensure_binary_files(lang)
+    for name in ENDPOINTS.values():
+        json_size = os.path.getsize(f"ambr/cache/{lang}/{name}.json")
+        bin_size = os.path.getsize(f"ambr/cache/{lang}/{name}.bin")
+        print(f"{name:<12} json {json_size:>10} B | bin {bin_size:>10} B")
+    for label, binary in (("json", False), ("bin", True)):
+        result = measure(lang, binary)
+        print(
+            f"[{label}] cold load {result['load'] * 1000:.2f}ms | "
+            f"first material lookup {result['lookup'] * 1000:.3f}ms | "
+            f"max RSS increase {result['rss_kb']} KB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""A compact binary format for the files under ambr/cache.
+
+Layout of a .bin file (all integers are little endian):
+
+    magic       8 bytes   b"AMBRBIN1"
+    count       uint32    number of records in data.items
+    meta_len    uint32    length of the meta block
+    meta        bytes     compact JSON of the endpoint data without data.items, plus the record keys
+    index       count * (uint64 offset, uint32 length) pointing into the record block
+    records     bytes     compact JSON of each record
+
+Endpoints without data.items (dailyDungeon, upgrade) are stored entirely in the meta block.
+The file is memory-mapped on load and a record is only decoded when it is accessed.
+"""
+
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, Iterator, List, Mapping
+
+MAGIC = b"AMBRBIN1"
+HEADER = struct.Struct("<8sII")
+INDEX_ENTRY = struct.Struct("<QI")
+
+
+class LazyItems(Mapping):
+    """A read-only mapping of item id to item data that decodes records from a memory-mapped file on access."""
+
+    def __init__(self, buffer: mmap.mmap, keys: List[str], index_offset: int, records_offset: int):
+        self._buffer = buffer
+        self._positions = {key: position for position, key in enumerate(keys)}
+        self._keys = keys
+        self._index_offset = index_offset
+        self._records_offset = records_offset
+        self._decoded: Dict[str, Dict] = {}
+
+    def __getitem__(self, key: str) -> Dict:
+        record = self._decoded.get(key)
+        if record is not None:
+            return record
+        position = self._positions[key]
+        offset, length = INDEX_ENTRY.unpack_from(
+            self._buffer, self._index_offset + position * INDEX_ENTRY.size
+        )
+        start = self._records_offset + offset
+        record = json.loads(self._buffer[start : start + length])
+        self._decoded[key] = record
+        return record
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+def dumps(data: Dict) -> bytes:
+    """Encode endpoint data into the binary format."""
+    meta: Dict[str, Any] = {"data": data}
+    items: Mapping = {}
+    if isinstance(data.get("data"), dict) and isinstance(data["data"].get("items"), Mapping):
+        items = data["data"]["items"]
+        meta = {
+            "data": {**data, "data": {k: v for k, v in data["data"].items() if k != "items"}},
+            "keys": list(items.keys()),
+        }
+
+    index = bytearray()
+    records = bytearray()
+    for record in items.values():
+        encoded = json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        index += INDEX_ENTRY.pack(len(records), len(encoded))
+        records += encoded
+
+    encoded_meta = json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return HEADER.pack(MAGIC, len(items), len(encoded_meta)) + encoded_meta + bytes(index) + bytes(records)
+
+
+def write(path: str, data: Dict) -> None:
+    """Write endpoint data to a binary cache file.
+
+    The file is written to a temporary path first and then renamed, so a mapped
+    file that is still being read is never modified in place.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(data))
+    os.replace(tmp_path, path)
+
+
+def load(path: str) -> Dict:
+    """Memory-map a binary cache file and return the endpoint data.
+
+    data.items is a LazyItems mapping, everything else is decoded up front. The header,
+    meta block and index are checked against the size of the file, so a truncated file
+    raises here instead of when one of its records is accessed.
+
+    Raises:
+        ValueError: If the file is not in the binary cache format or is truncated.
+    """
+    with open(path, "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        if len(buffer) < HEADER.size:
+            raise ValueError(f"Truncated binary cache file: {path}")
+        magic, count, meta_len = HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Invalid binary cache file: {path}")
+        meta_offset = HEADER.size
+        index_offset = meta_offset + meta_len
+        records_offset = index_offset + count * INDEX_ENTRY.size
+        if records_offset > len(buffer):
+            raise ValueError(f"Truncated binary cache file: {path}")
+
+        meta = json.loads(buffer[meta_offset:index_offset])
+        data = meta["data"]
+        if "keys" not in meta:
+            buffer.close()
+            return data
+        if len(meta["keys"]) != count:
+            raise ValueError(f"Invalid binary cache file: {path}")
+        records_len = len(buffer) - records_offset
+        for offset, length in INDEX_ENTRY.iter_unpack(buffer[index_offset:records_offset]):
+            if offset + length > records_len:
+                raise ValueError(f"Truncated binary cache file: {path}")
+        data["data"]["items"] = LazyItems(buffer, meta["keys"], index_offset, records_offset)
+        return data
+    except (KeyError, TypeError) as e:
+        buffer.close()
+        raise ValueError(f"Invalid binary cache file: {path}") from e
+    except BaseException:
+        buffer.close()
+        raise
+
+
+def export_json(path: str, json_path: str) -> None:
+    """Export a binary cache file as JSON."""
+    data = load(path)
+    if isinstance(data.get("data"), dict) and isinstance(data["data"].get("items"), LazyItems):
+        data["data"]["items"] = dict(data["data"]["items"])
+    with open(json_path, "w+", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=4)
@@ -1,10 +1,14 @@
+import asyncio
+import hashlib
 import json
 import os
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Type, TypeVar
 
 import aiohttp
+from cachetools import LRUCache
 
+from ambr import binary_cache, detail_cache
 from ambr.constants import CITIES, EVENTS_URL, LANGS, WEEKDAYS
 from ambr.endpoints import BASE, ENDPOINTS, STATIC_ENDPOINTS
 from ambr.models import (
@@ -32,6 +36,24 @@ from ambr.models import (
     WeaponDetail,
     WeaponUpgrade,
 )
+from ambr.snapshot import (
+    EndpointUpdate,
+    MaterialUsers,
+    cache_file_path,
+    get_snapshot,
+    read_cache_file,
+    read_validators,
+    reload_snapshot,
+    write_validators,
+)
+from utility.utils import log
+
+T = TypeVar("T")
+
+EVENTS_TTL = 30 * 60
+_events: Optional[Tuple[float, List[Event]]] = None
+_events_refresh: Optional[asyncio.Task] = None
+_book_stories: LRUCache = LRUCache(maxsize=512)
 
 
 def get_decorator(func):
@@ -52,26 +74,7 @@ class AmbrTopAPI:
             raise ValueError(
                 f"Invalid language: {self.lang}, valid values are: {LANGS.keys()}"
             )
-        self.cache = self.load_cache()
-
-    def load_cache(self) -> Dict:
-        """Load cache from files.
-
-        Returns:
-            Dict: Cache.
-        """
-        cache = {}
-        for lang in list(LANGS.keys()):
-            if lang not in cache:
-                cache[lang] = {}
-            for endpoint in list(ENDPOINTS.keys()):
-                cache[lang][endpoint] = self.request_from_cache(endpoint)
-        for static_endpoint in list(STATIC_ENDPOINTS.keys()):
-            cache[static_endpoint] = self.request_from_cache(
-                static_endpoint, static=True
-            )
-
-        return cache
+        self.cache = get_snapshot()
 
     def get_cache(self, endpoint: str, static: bool = False) -> Dict:
         """Get the cache of an endpoint.
@@ -83,10 +86,7 @@ class AmbrTopAPI:
         Returns:
             Dict: The cache of the endpoint.
         """
-        if static:
-            return self.cache[endpoint]
-        else:
-            return self.cache[self.lang][endpoint]
+        return self.cache.get(endpoint, self.lang, static)
 
     async def request_from_endpoint(
         self,
@@ -120,6 +120,21 @@ class AmbrTopAPI:
             raise ValueError(f"Invalid endpoint = {endpoint} | URL = {endpoint_url}")
         return endpoint_data
 
+    async def request_detail(self, endpoint: str, id: str | int) -> Dict:
+        """Request the detail of an item, cached on disk until the next nightly update.
+
+        Args:
+            endpoint (str): Name of the endpoint.
+            id (str | int): The id of the item.
+
+        Returns:
+            Dict: The data of the endpoint.
+        """
+        return await detail_cache.get_detail(
+            (self.lang, endpoint, str(id)),
+            lambda: self.request_from_endpoint(endpoint, id=id),
+        )
+
     def request_from_cache(self, endpoint: str, static: bool = False) -> Dict:
         """Request an endpoint data from cache.
 
@@ -130,41 +145,119 @@ class AmbrTopAPI:
         Returns:
             Dict: Endpoint data.
         """
+        return read_cache_file(endpoint, self.lang, static)
+
+    @staticmethod
+    def write_cache(data: Dict, endpoint: str, lang: str = "", static: bool = False) -> None:
+        """Write the data of an endpoint to the cache, in the binary format used for loading and as a JSON export.
+
+        Both files are written to a temporary path and then renamed, so readers never see a half-written file.
+
+        Args:
+            data (Dict): The data of the endpoint.
+            endpoint (str): The name of the endpoint.
+            lang (str, optional): The language of the endpoint. Defaults to "".
+            static (bool, optional): Whether the endpoint is static data or not. Defaults to False.
+        """
+        binary_cache.write(cache_file_path(endpoint, lang, static, binary=True), data)
+        path = cache_file_path(endpoint, lang, static)
+        with open(f"{path}.tmp", "w+", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+        os.replace(f"{path}.tmp", path)
+
+    async def update_endpoint_cache(
+        self,
+        endpoint: str,
+        lang: str,
+        static: bool,
+        validators: Dict[str, Dict[str, str]],
+        semaphore: asyncio.Semaphore,
+    ) -> EndpointUpdate:
+        """Update the cache of one endpoint if its data changed.
+
+        A conditional request is sent with the ETag and Last-Modified of the last update,
+        the body is also compared with the hash of the last update in case the server ignores them.
+
+        Args:
+            endpoint (str): The name of the endpoint.
+            lang (str): The language of the endpoint.
+            static (bool): Whether the endpoint is static data or not.
+            validators (Dict[str, Dict[str, str]]): The validators of the last update, updated in place.
+            semaphore (asyncio.Semaphore): Limits the number of concurrent requests.
+
+        Returns:
+            EndpointUpdate: The result of the update.
+        """
+        key = f"static/{endpoint}" if static else f"{lang}/{endpoint}"
+        previous = validators.get(key, {})
+        if not os.path.exists(cache_file_path(endpoint, lang, static, binary=True)):
+            previous = {}
+        headers = {}
+        if "etag" in previous:
+            headers["If-None-Match"] = previous["etag"]
+        if "last_modified" in previous:
+            headers["If-Modified-Since"] = previous["last_modified"]
         if static:
-            try:
-                with open(
-                    f"ambr/cache/static/{STATIC_ENDPOINTS.get(endpoint)}.json",
-                    "r",
-                    encoding="utf-8",
-                ) as f:
-                    endpoint_data = json.load(f)
-            except FileNotFoundError:
-                endpoint_data = {}
+            url = f"{BASE}static/{STATIC_ENDPOINTS.get(endpoint)}"
         else:
-            try:
-                with open(
-                    f"ambr/cache/{self.lang}/{ENDPOINTS.get(endpoint)}.json",
-                    "r",
-                    encoding="utf-8",
-                ) as f:
-                    endpoint_data = json.load(f)
-            except FileNotFoundError:
-                endpoint_data = {}
+            url = f"{BASE}{lang}/{ENDPOINTS.get(endpoint)}/"
 
-        return endpoint_data
+        start = time.perf_counter()
+        async with semaphore:
+            try:
+                async with self.session.get(url, headers=headers) as r:
+                    if r.status == 304:
+                        return EndpointUpdate(key, False, time.perf_counter() - start)
+                    body = await r.read()
+                    response_headers = r.headers
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                return EndpointUpdate(key, False, time.perf_counter() - start, str(e))
+
+        content_hash = hashlib.sha256(body).hexdigest()
+        if content_hash == previous.get("hash"):
+            return EndpointUpdate(key, False, time.perf_counter() - start)
+
+        def parse_and_write() -> None:
+            data = json.loads(body)
+            if "code" in data:
+                raise ValueError(f"Invalid endpoint = {endpoint} | URL = {url}")
+            os.makedirs(os.path.dirname(cache_file_path(endpoint, lang, static)), exist_ok=True)
+            self.write_cache(data, endpoint, lang, static)
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, parse_and_write)
+        except (ValueError, OSError) as e:
+            # the validators are kept, so the endpoint is downloaded again on the next update
+            return EndpointUpdate(key, False, time.perf_counter() - start, str(e))
+
+        validators[key] = {"hash": content_hash}
+        if "ETag" in response_headers:
+            validators[key]["etag"] = response_headers["ETag"]
+        if "Last-Modified" in response_headers:
+            validators[key]["last_modified"] = response_headers["Last-Modified"]
+        return EndpointUpdate(key, True, time.perf_counter() - start)
 
     async def update_cache(
         self,
         all_lang: bool = False,
         endpoint: str = "",
         static: bool = False,
-    ) -> None:
+        concurrency: int = 8,
+    ) -> List[EndpointUpdate]:
         """Update the cache of the API by sending requests to the API through an aiohttp session.
 
+        Endpoints are fetched concurrently and only the ones whose data changed are rewritten.
+        The cache snapshot is reloaded if anything changed.
+
         Args:
             all_lang (bool, optional): To update the cache of all languages. Defaults to False.
             endpoint (Optional[str], optional): To update a specific endpoint. Defaults to None.
             static (bool, optional): To update static endpoints. Defaults to False.
+            concurrency (int, optional): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            List[EndpointUpdate]: The result of the update of each endpoint.
         """
         if all_lang:
             langs = list(LANGS.keys())
@@ -177,29 +270,24 @@ class AmbrTopAPI:
                 endpoints = list(STATIC_ENDPOINTS.keys())
         else:
             endpoints = [endpoint]
-
         if static:
-            for endpoint in endpoints:
-                data = await self.request_from_endpoint(endpoint, static=True)
-                with open(
-                    f"ambr/cache/static/{STATIC_ENDPOINTS.get(endpoint)}.json",
-                    "w+",
-                    encoding="utf-8",
-                ) as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
-        else:
-            for lang in langs:
-                for endpoint in endpoints:
-                    data = await self.request_from_endpoint(endpoint, lang)
-                    path = f"ambr/cache/{lang}"
-                    if not os.path.exists(path):
-                        os.makedirs(path)
-                    with open(
-                        f"ambr/cache/{lang}/{ENDPOINTS.get(endpoint)}.json",
-                        "w+",
-                        encoding="utf-8",
-                    ) as f:
-                        json.dump(data, f, ensure_ascii=False, indent=4)
+            langs = [""]
+
+        validators = read_validators()
+        semaphore = asyncio.Semaphore(concurrency)
+        results: List[EndpointUpdate] = await asyncio.gather(
+            *[
+                self.update_endpoint_cache(endpoint, lang, static, validators, semaphore)
+                for lang in langs
+                for endpoint in endpoints
+            ]
+        )
+        write_validators(validators)
+
+        if any(result.changed for result in results):
+            loop = asyncio.get_running_loop()
+            self.cache = await loop.run_in_executor(None, reload_snapshot)
+        return results
 
     async def get_character_detail(self, id: str) -> Optional[CharacterDetail]:
         """Get the detail of a character.
@@ -210,7 +298,7 @@ class AmbrTopAPI:
         Returns:
             Optional[CharacterDetail]: A CharacterDetail object.
         """
-        data = await self.request_from_endpoint("character", id=id)
+        data = await self.request_detail("character", id)
         result = CharacterDetail(**data["data"])
         return result
 
@@ -223,7 +311,7 @@ class AmbrTopAPI:
         Returns:
             Optional[MonsterDetail]: A MonsterDetail object.
         """
-        data = await self.request_from_endpoint("monster", id=id)
+        data = await self.request_detail("monster", id)
         result = MonsterDetail(**data["data"])
         return result
 
@@ -236,7 +324,7 @@ class AmbrTopAPI:
         Returns:
             Optional[FoodDetail]: A FoodDetail object.
         """
-        data = await self.request_from_endpoint("food", id=id)
+        data = await self.request_detail("food", id)
         result = FoodDetail(**data["data"])
         return result
 
@@ -249,7 +337,7 @@ class AmbrTopAPI:
         Returns:
             Optional[FurnitureDetail]: A FurnitureDetail object.
         """
-        data = await self.request_from_endpoint("furniture", id=id)
+        data = await self.request_detail("furniture", id)
         result = FurnitureDetail(**data["data"])
         return result
 
@@ -262,7 +350,7 @@ class AmbrTopAPI:
         Returns:
             Optional[BookDetail]: A BookDetail object.
         """
-        data = await self.request_from_endpoint("book", id=id)
+        data = await self.request_detail("book", id)
         result = BookDetail(**data["data"])
         return result
 
@@ -275,7 +363,7 @@ class AmbrTopAPI:
         Returns:
             Optional[NameCardDetail]: A NameCardDetail object.
         """
-        data = await self.request_from_endpoint("namecard", id=id)
+        data = await self.request_detail("namecard", id)
         result = NameCardDetail(**data["data"])
         return result
 
@@ -288,7 +376,7 @@ class AmbrTopAPI:
         Returns:
             Optional[MaterialDetail]: A material detail object.
         """
-        data = await self.request_from_endpoint("material", id=id)
+        data = await self.request_detail("material", id)
         result = MaterialDetail(**data["data"])
         return result
 
@@ -301,7 +389,7 @@ class AmbrTopAPI:
         Returns:
             WeaponDetail: A weapon detail object.
         """
-        data = await self.request_from_endpoint("weapon", id=id)
+        data = await self.request_detail("weapon", id)
         result = WeaponDetail(**data["data"])
         return result
 
@@ -314,10 +402,31 @@ class AmbrTopAPI:
         Returns:
             Optional[ArtifactDetail]: An artifact detail object.
         """
-        data = await self.request_from_endpoint("artifact", id=id)
+        data = await self.request_detail("artifact", id)
         result = ArtifactDetail(**data["data"])
         return result
 
+    def get_model(self, endpoint: str, model: Type[T], id: str | int) -> T:
+        """Get a model of an item in the cache of an endpoint.
+
+        Models are memoized per (lang, endpoint, id) and shared, so they are frozen.
+
+        Args:
+            endpoint (str): The name of the endpoint.
+            model (Type[T]): The model class to build.
+            id (str | int): The id of the item.
+
+        Raises:
+            KeyError: If the item is not in the cache.
+
+        Returns:
+            T: The model.
+        """
+        return self.cache.get_model(
+            (self.lang, endpoint, str(id)),
+            lambda: model(**self.get_cache(endpoint)["data"]["items"][str(id)]),
+        )
+
     @get_decorator
     async def get_material(
         self, id: Optional[int] = None
@@ -333,10 +442,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("material")
         if id is not None:
-            return Material(**data["data"]["items"][str(id)])
+            return self.get_model("material", Material, id)
         else:
-            for material in data["data"]["items"].values():
-                result.append(Material(**material))
+            for material_id in data["data"]["items"]:
+                result.append(self.get_model("material", Material, material_id))
 
             return result
 
@@ -355,10 +464,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("namecard")
         if id is not None:
-            return NameCard(**data["data"]["items"][str(id)])
+            return self.get_model("namecard", NameCard, id)
         else:
-            for name_card in data["data"]["items"].values():
-                result.append(NameCard(**name_card))
+            for name_card_id in data["data"]["items"]:
+                result.append(self.get_model("namecard", NameCard, name_card_id))
 
             return result
 
@@ -377,10 +486,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("artifact")
         if id is not None:
-            return Artifact(**data["data"]["items"][str(id)])
+            return self.get_model("artifact", Artifact, id)
         else:
-            for material in data["data"]["items"].values():
-                result.append(Artifact(**material))
+            for artifact_id in data["data"]["items"]:
+                result.append(self.get_model("artifact", Artifact, artifact_id))
 
             return result
 
@@ -397,10 +506,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("book")
         if id is not None:
-            return Book(**data["data"]["items"][str(id)])
+            return self.get_model("book", Book, id)
         else:
-            for material in data["data"]["items"].values():
-                result.append(Book(**material))
+            for book_id in data["data"]["items"]:
+                result.append(self.get_model("book", Book, book_id))
 
             return result
 
@@ -417,10 +526,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("food")
         if id is not None:
-            return Food(**data["data"]["items"][str(id)])
+            return self.get_model("food", Food, id)
         else:
-            for material in data["data"]["items"].values():
-                result.append(Food(**material))
+            for food_id in data["data"]["items"]:
+                result.append(self.get_model("food", Food, food_id))
 
             return result
 
@@ -439,10 +548,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("furniture")
         if id is not None:
-            return Furniture(**data["data"]["items"][str(id)])
+            return self.get_model("furniture", Furniture, id)
         else:
-            for material in data["data"]["items"].values():
-                result.append(Furniture(**material))
+            for furniture_id in data["data"]["items"]:
+                result.append(self.get_model("furniture", Furniture, furniture_id))
 
             return result
 
@@ -466,7 +575,7 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("character")
         if id is not None:
-            return Character(**data["data"]["items"][str(id)])
+            return self.get_model("character", Character, id)
         else:
             for character_id, character_info in data["data"]["items"].items():
                 if "beta" in character_info and not include_beta:
@@ -475,7 +584,7 @@ class AmbrTopAPI:
                     "10000005" in character_id or "10000007" in character_id
                 ) and not include_traveler:
                     continue
-                result.append(Character(**character_info))
+                result.append(self.get_model("character", Character, character_id))
 
             return result
 
@@ -494,10 +603,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("weapon")
         if id is not None:
-            return Weapon(**data["data"]["items"][str(id)])
+            return self.get_model("weapon", Weapon, id)
         else:
-            for weapon in data["data"]["items"].values():
-                result.append(Weapon(**weapon))
+            for weapon_id in data["data"]["items"]:
+                result.append(self.get_model("weapon", Weapon, weapon_id))
         return result
 
     @get_decorator
@@ -515,10 +624,10 @@ class AmbrTopAPI:
         result = []
         data = self.get_cache("monster")
         if id is not None:
-            return Monster(**data["data"]["items"][str(id)])
+            return self.get_model("monster", Monster, id)
         else:
-            for monster in data["data"]["items"].values():
-                result.append(Monster(**monster))
+            for monster_id in data["data"]["items"]:
+                result.append(self.get_model("monster", Monster, monster_id))
         return result
 
     async def get_weapon_types(self) -> Dict[str, str]:
@@ -540,28 +649,16 @@ class AmbrTopAPI:
             character_id (Optional[str], optional): id of the character. Defaults to None.
 
         Returns:
-            Optional[List[CharacterUpgrade] | CharacterUpgrade]: A list of all character upgrades or a specific character upgrade.
+            Optional[List[CharacterUpgrade] | CharacterUpgrade]: A list of all character upgrades or a specific character upgrade, the list is shared and must not be mutated.
         """
-        result = []
-        data = self.get_cache("upgrade", static=True)
+        upgrades = self.cache.get_derived(
+            ("character_upgrades", self.lang),
+            lambda: self.build_upgrades("avatar", CharacterUpgrade, "character_id"),
+        )
         if character_id is not None:
-            upgrade_info = data["data"]["avatar"][character_id]
-            upgrade_info["character_id"] = character_id
-            upgrade_info["item_list"] = [
-                (await self.get_material(id=int(material_id)))
-                for material_id in upgrade_info["items"]
-            ]
-            return CharacterUpgrade(**upgrade_info)
+            return upgrades[str(character_id)]
         else:
-            for upgrade_id, upgrade_info in data["data"]["avatar"].items():
-                upgrade_info["item_list"] = [
-                    (await self.get_material(id=int(material_id)))
-                    for material_id in upgrade_info["items"]
-                ]
-                upgrade_info["character_id"] = upgrade_id
-                result.append(CharacterUpgrade(**upgrade_info))
-
-            return result
+            return upgrades["all"]
 
     @get_decorator
     async def get_weapon_upgrade(
@@ -573,40 +670,82 @@ class AmbrTopAPI:
             weapon_id (Optional[int], optional): id of the weapon. Defaults to None.
 
         Returns:
-            Optional[List[WeaponUpgrade] | WeaponUpgrade]: A list of all weapon upgrades or a specific weapon upgrade.
+            Optional[List[WeaponUpgrade] | WeaponUpgrade]: A list of all weapon upgrades or a specific weapon upgrade, the list is shared and must not be mutated.
         """
-        data = self.get_cache("upgrade", static=True)
+        upgrades = self.cache.get_derived(
+            ("weapon_upgrades", self.lang),
+            lambda: self.build_upgrades("weapon", WeaponUpgrade, "weapon_id"),
+        )
         if weapon_id is not None:
-            upgrade_info = data["data"]["weapon"][str(weapon_id)]
-            upgrade_info["weapon_id"] = weapon_id
-            upgrade_info["item_list"] = [
-                (await self.get_material(id=int(material_id)))
-                for material_id in upgrade_info["items"]
-            ]
-            return WeaponUpgrade(**upgrade_info)
+            return upgrades[str(weapon_id)]
         else:
-            result = []
-            for upgrade_id, upgrade_info in data["data"]["weapon"].items():
-                upgrade_info["weapon_id"] = upgrade_id
-                upgrade_info["item_list"] = [
-                    (await self.get_material(id=int(material_id)))
-                    for material_id in upgrade_info["items"]
-                ]
-                result.append(WeaponUpgrade(**upgrade_info))
+            return upgrades["all"]
 
-            return result
+    def build_upgrades(
+        self, kind: str, model: Type[T], id_field: str
+    ) -> Dict[str, T | List[T]]:
+        """Build the upgrade table of characters or weapons in the current language.
 
-    async def get_domain(self) -> List[Domain]:
-        """Get a list of all domains.
+        Args:
+            kind (str): "avatar" or "weapon", the key in the static upgrade data.
+            model (Type[T]): CharacterUpgrade or WeaponUpgrade.
+            id_field (str): The name of the id field of the model.
 
         Returns:
-            List[Domain]: A list of all domains.
+            Dict[str, T | List[T]]: A dictionary of id to upgrade, "all" holds a list of every upgrade.
         """
-        result = []
+        table: Dict[str, T | List[T]] = {}
+        result: List[T] = []
+        data = self.get_cache("upgrade", static=True)
+        for upgrade_id, upgrade_info in data["data"][kind].items():
+            item_list = []
+            for material_id in upgrade_info["items"]:
+                try:
+                    item_list.append(self.get_model("material", Material, material_id))
+                except KeyError:
+                    continue
+            upgrade = model(**{**upgrade_info, id_field: upgrade_id, "item_list": item_list})
+            table[upgrade_id] = upgrade
+            result.append(upgrade)
+        table["all"] = result
+        return table
+
+    def get_material_users(self, material_id: int) -> MaterialUsers:
+        """Get the characters and weapons that use a material to upgrade.
+
+        Args:
+            material_id (int): id of the material.
+
+        Returns:
+            MaterialUsers: The ids of the characters and weapons, these lists are shared and must not be mutated.
+        """
+        return self.cache.material_users().get(int(material_id), MaterialUsers([], []))
+
+    async def get_domain(self, weekday: Optional[int] = None) -> List[Domain]:
+        """Get a list of all domains or the domains that are open on a weekday.
+
+        Args:
+            weekday (Optional[int], optional): The weekday, 0 is monday. Defaults to None.
+
+        Returns:
+            List[Domain]: A list of domains, this list is shared and must not be mutated.
+        """
+        calendar = self.cache.get_derived(("domains", self.lang), self.build_domain_calendar)
+        if weekday is None:
+            return calendar["all"]
+        return calendar.get(weekday, [])
+
+    def build_domain_calendar(self) -> Dict[int | str, List[Domain]]:
+        """Build the domain calendar of the current language.
+
+        Returns:
+            Dict[int | str, List[Domain]]: A dictionary of weekday to the domains open on that day, "all" holds every domain.
+        """
+        calendar: Dict[int | str, List[Domain]] = {"all": []}
         data = self.get_cache("domain")
         for weekday, domain_dict in data["data"].items():
             weekday_int = WEEKDAYS.get(weekday, 0)
-            for _, domain_info in domain_dict.items():
+            for domain_info in domain_dict.values():
                 city_id = domain_info["city"]
                 city_lang_dict = CITIES.get(
                     city_id,
@@ -630,31 +769,87 @@ class AmbrTopAPI:
                 rewards = []
                 for reward in domain_info["reward"]:
                     if len(str(reward)) == 6:
-                        material = await self.get_material(id=reward)
-                        rewards.append(material)
-                domain_info["city"] = city
-                domain_info["weekday"] = weekday_int
-                domain_info["reward"] = rewards
-                result.append(Domain(**domain_info))
+                        try:
+                            rewards.append(self.get_model("material", Material, reward))
+                        except KeyError:
+                            continue
+                domain = Domain(
+                    id=domain_info["id"],
+                    name=domain_info["name"],
+                    reward=rewards,
+                    city=city,
+                    weekday=weekday_int,
+                )
+                calendar.setdefault(weekday_int, []).append(domain)
+                calendar["all"].append(domain)
 
-        return result
+        return calendar
 
     async def get_events(self) -> List[Event]:
         """Get a list of all events.
 
+        Events are kept in memory, once they are older than EVENTS_TTL the old list
+        is returned while a new one is fetched in the background.
+
         Returns:
-            List[Event]: A list of all events.
+            List[Event]: A list of all events, this list is shared and must not be mutated.
         """
-        result = []
-        async with self.session.get(EVENTS_URL) as resp:
-            data = await resp.json()
-            for event in list(data.values()):
-                result.append(Event(**event))
-        return result
+        global _events_refresh
+        stale = _events is None or time.monotonic() - _events[0] > EVENTS_TTL
+        if stale and (_events_refresh is None or _events_refresh.done()):
+            _events_refresh = asyncio.create_task(self.refresh_events())
+        if _events is None:
+            await asyncio.shield(_events_refresh)
+        return _events[1]
+
+    async def refresh_events(self) -> None:
+        """Fetch the events from ambr.top and replace the events in memory."""
+        global _events
+        try:
+            result = []
+            async with self.session.get(EVENTS_URL) as resp:
+                data = await resp.json()
+                for event in list(data.values()):
+                    result.append(Event(**event))
+        except Exception as e:
+            if _events is None:
+                raise
+            log.warning(f"[Ambr Events] Refresh failed, serving old events: {e}")
+        else:
+            _events = (time.monotonic(), result)
 
     async def get_book_story(self, story_id: str) -> str:
+        """Get the story of a book volume, stories are kept in an LRU cache.
+
+        Args:
+            story_id (str): The story id of the volume.
+
+        Returns:
+            str: The story.
+        """
+        key = (self.lang, str(story_id))
+        story = _book_stories.get(key)
+        if story is not None:
+            return story
         async with self.session.get(
             f"https://api.ambr.top/v2/{self.lang}/readable/Book{story_id}"
         ) as resp:
             story = await resp.json()
+        _book_stories[key] = story["data"]
         return story["data"]
+
+    async def get_book_stories(self, book: BookDetail) -> Dict[str, str]:
+        """Get the stories of all volumes of a book concurrently.
+
+        Args:
+            book (BookDetail): The book.
+
+        Returns:
+            Dict[str, str]: A dictionary of story id to story.
+        """
+        stories = await asyncio.gather(
+            *[self.get_book_story(volume.story_id) for volume in book.volumes]
+        )
+        return {
+            volume.story_id: story for volume, story in zip(book.volumes, stories)
+        }
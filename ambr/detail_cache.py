@@ -0,0 +1,85 @@
+import asyncio
+import copy
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+import aiohttp
+from diskcache import FanoutCache
+
+from utility.utils import get_dt_now, log
+
+# the ambr cache is updated at 1am by the schedule cog, details fetched before that are stale
+UPDATE_HOUR = 1
+# how long to wait for ambr.top before serving a stale copy
+STALE_TIMEOUT = 5
+# stale copies are kept this long in case ambr.top is down
+MAX_AGE = 7 * 24 * 60 * 60
+
+_cache: Optional[FanoutCache] = None
+_requests: Dict[Tuple[str, str, str], asyncio.Task] = {}
+
+
+def get_cache() -> FanoutCache:
+    global _cache
+    if _cache is None:
+        _cache = FanoutCache("data/cache/ambr_detail_cache")
+    return _cache
+
+
+def last_update_time() -> datetime:
+    """Get the time of the last nightly update of the ambr cache."""
+    now = get_dt_now()
+    update_time = now.replace(hour=UPDATE_HOUR, minute=0, second=0, microsecond=0)
+    if now < update_time:
+        update_time -= timedelta(days=1)
+    return update_time
+
+
+async def get_detail(
+    key: Tuple[str, str, str], fetch: Callable[[], Awaitable[Dict]]
+) -> Dict:
+    """Get the payload of a detail endpoint from the disk cache or from ambr.top.
+
+    Concurrent calls with the same key share one request. A cached payload fetched
+    after the last nightly update is served directly, an older one is served if
+    ambr.top fails or takes longer than STALE_TIMEOUT seconds.
+
+    Args:
+        key (Tuple[str, str, str]): (lang, endpoint, id) of the detail.
+        fetch (Callable[[], Awaitable[Dict]]): Requests the payload from ambr.top.
+
+    Returns:
+        Dict: The payload, a copy that the caller may mutate.
+    """
+    task = _requests.get(key)
+    if task is None:
+        task = asyncio.create_task(_get_detail(key, fetch))
+        _requests[key] = task
+        task.add_done_callback(lambda _: _requests.pop(key, None))
+    return copy.deepcopy(await asyncio.shield(task))
+
+
+async def _get_detail(
+    key: Tuple[str, str, str], fetch: Callable[[], Awaitable[Dict]]
+) -> Dict:
+    cache = get_cache()
+    cache_key = "/".join(key)
+    cached = cache.get(cache_key)
+    if cached is not None and cached["time"] >= last_update_time().timestamp():
+        return cached["data"]
+
+    try:
+        if cached is None:
+            data = await fetch()
+        else:
+            data = await asyncio.wait_for(fetch(), timeout=STALE_TIMEOUT)
+    except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+        if cached is None:
+            raise
+        log.warning(f"[Ambr Detail Cache] Serving stale {cache_key}: {type(e).__name__} {e}")
+        return cached["data"]
+
+    cache.set(
+        cache_key, {"time": get_dt_now().timestamp(), "data": data}, expire=MAX_AGE
+    )
+    return data
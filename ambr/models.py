@@ -7,7 +7,14 @@ from data.game.elements import convert_element, convert_elements
 from utility.utils import format_number, parse_HTML
 
 
-class City(BaseModel):
+class FrozenModel(BaseModel):
+    """A model built from the ambr cache, instances are memoized and shared between callers so they are immutable."""
+
+    class Config:
+        frozen = True
+
+
+class City(FrozenModel):
     id: int
     name: str
 
@@ -16,7 +23,7 @@ class PartialMaterial(BaseModel):
     id: str
 
 
-class Event(BaseModel):
+class Event(FrozenModel):
     id: int
     name: Dict[str, str]
     full_name: Dict[str, str] = Field(alias="nameFull")
@@ -25,7 +32,7 @@ class Event(BaseModel):
     end_time: str = Field(alias="endAt")
 
 
-class Weapon(BaseModel):
+class Weapon(FrozenModel):
     id: int
     rarity: int = Field(alias="rank")
     type: str
@@ -56,7 +63,7 @@ class Weapon(BaseModel):
             return True
 
 
-class Character(BaseModel):
+class Character(FrozenModel):
     id: str
     name: str
     rairty: int = Field(alias="rank")
@@ -76,7 +83,7 @@ class Character(BaseModel):
         return element_name
 
 
-class Material(BaseModel):
+class Material(FrozenModel):
     id: int
     name: str
     type: Optional[str] = None
@@ -94,7 +101,7 @@ class Material(BaseModel):
         return icon_url
 
 
-class Domain(BaseModel):
+class Domain(FrozenModel):
     id: int
     name: str
     rewards: List[Material] = Field(alias="reward")
@@ -102,13 +109,13 @@ class Domain(BaseModel):
     weekday: int
 
 
-class CharacterUpgrade(BaseModel):
+class CharacterUpgrade(FrozenModel):
     character_id: str
     items: List[Material] = Field(alias="item_list")
     beta: bool = False
 
 
-class WeaponUpgrade(BaseModel):
+class WeaponUpgrade(FrozenModel):
     weapon_id: int
     items: List[Material] = Field(alias="item_list")
     beta: bool = False
@@ -121,6 +128,7 @@ class MaterialSource(BaseModel):
 
 
 class MaterialDetail(BaseModel):
+    id: int
     name: str
     description: str
     type: str
@@ -204,7 +212,7 @@ class WeaponUpgradeDetail(BaseModel):
         return result
 
 
-class Artifact(BaseModel):
+class Artifact(FrozenModel):
     id: int
     name: str
     rarity_list: List[int] = Field(alias="levelList")
@@ -479,7 +487,7 @@ class CharacterDetail(BaseModel):
         return result
 
 
-class Monster(BaseModel):
+class Monster(FrozenModel):
     id: int
     name: str
     type: str
@@ -546,7 +554,7 @@ class MonsterDetail(BaseModel):
         return MonsterData(**list(v.values())[0])
 
 
-class Food(BaseModel):
+class Food(FrozenModel):
     id: int
     name: str
     type: str
@@ -640,7 +648,7 @@ class FoodDetail(BaseModel):
         return result
 
 
-class Furniture(BaseModel):
+class Furniture(FrozenModel):
     id: int
     name: str
     cost: Optional[int] = None
@@ -714,7 +722,7 @@ class FurnitureDetail(BaseModel):
         return icon_url
 
 
-class NameCard(BaseModel):
+class NameCard(FrozenModel):
     id: int
     name: str
     icon: str
@@ -746,7 +754,7 @@ class NameCardDetail(BaseModel):
         return parse_HTML(v)
 
 
-class Book(BaseModel):
+class Book(FrozenModel):
     id: int
     name: str
     icon: str
@@ -0,0 +1,261 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+
+from ambr import binary_cache
+from ambr.endpoints import ENDPOINTS, STATIC_ENDPOINTS
+from utility.loading_cache import LoadingCache
+from utility.reloadable import Reloadable
+from utility.utils import log
+
+MODEL_CACHE_SIZE = 16384
+
+T = TypeVar("T")
+
+
+class MaterialUsers(NamedTuple):
+    """The characters and weapons that use a material to upgrade."""
+
+    characters: List[str]
+    weapons: List[int]
+
+
+def cache_file_path(
+    endpoint: str, lang: str = "", static: bool = False, binary: bool = False
+) -> str:
+    """Get the path of the cache file of an endpoint."""
+    extension = "bin" if binary else "json"
+    if static:
+        return f"ambr/cache/static/{STATIC_ENDPOINTS.get(endpoint)}.{extension}"
+    return f"ambr/cache/{lang}/{ENDPOINTS.get(endpoint)}.{extension}"
+
+
+def read_cache_file(endpoint: str, lang: str = "", static: bool = False) -> Dict:
+    """Read the cached data of an endpoint from disk.
+
+    The binary cache file is memory-mapped if it exists, otherwise the JSON file is parsed.
+
+    Args:
+        endpoint (str): The name of the endpoint.
+        lang (str, optional): The language of the endpoint. Defaults to "".
+        static (bool, optional): Whether the endpoint is static data or not. Defaults to False.
+
+    Returns:
+        Dict: Endpoint data, an empty dict if the file doesn't exist.
+    """
+    try:
+        return binary_cache.load(cache_file_path(endpoint, lang, static, binary=True))
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        log.warning(f"[Ambr Cache] {e}, falling back to JSON")
+    try:
+        with open(cache_file_path(endpoint, lang, static), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def cache_file_size(endpoint: str, lang: str = "", static: bool = False) -> int:
+    """Get the size of the cache file that read_cache_file would read, 0 if there is none."""
+    for binary in (True, False):
+        path = cache_file_path(endpoint, lang, static, binary)
+        if os.path.exists(path):
+            return os.path.getsize(path)
+    return 0
+
+
+class EndpointUpdate(NamedTuple):
+    """The result of updating the cache of an endpoint."""
+
+    endpoint: str
+    changed: bool
+    time: float
+    error: Optional[str] = None
+
+
+VALIDATORS_PATH = "ambr/cache/validators.json"
+
+
+def read_validators() -> Dict[str, Dict[str, str]]:
+    """Read the ETag, Last-Modified and content hash of the last update of each endpoint."""
+    try:
+        with open(VALIDATORS_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_validators(validators: Dict[str, Dict[str, str]]) -> None:
+    """Write the validators of the last update of each endpoint."""
+    with open(f"{VALIDATORS_PATH}.tmp", "w+", encoding="utf-8") as f:
+        json.dump(validators, f, indent=4)
+    os.replace(f"{VALIDATORS_PATH}.tmp", VALIDATORS_PATH)
+
+
+class CacheSnapshot:
+    """A read-only view of everything under ambr/cache.
+
+    One snapshot is shared by every AmbrTopAPI instance, so the data in it must never be mutated.
+    A new snapshot is built and swapped in by reload_snapshot after the cache files are updated.
+
+    Endpoints are loaded the first time they are requested for a language and then stay resident.
+    Models built from the data are memoized per snapshot, so they are dropped together with it.
+    """
+
+    def __init__(self, version: int):
+        self.version = version
+        self.data: Dict[str, Dict[str, Dict]] = {}
+        self.static: Dict[str, Dict] = {}
+        self.sizes: Dict[str, int] = {}
+        self.models: LoadingCache[Tuple[str, str, str], Any] = LoadingCache(MODEL_CACHE_SIZE)
+        self.derived: Dict[Any, Any] = {}
+        self._lock = threading.Lock()
+        self._derived_lock = threading.Lock()
+
+    def get(self, endpoint: str, lang: str = "", static: bool = False) -> Dict:
+        """Get the cached data of an endpoint, loading it from disk on first use.
+
+        Args:
+            endpoint (str): The name of the endpoint.
+            lang (str, optional): The language of the endpoint. Defaults to "".
+            static (bool, optional): Whether the endpoint is static data or not. Defaults to False.
+
+        Returns:
+            Dict: Endpoint data.
+        """
+        try:
+            if static:
+                return self.static[endpoint]
+            return self.data[lang][endpoint]
+        except KeyError:
+            return self.load(endpoint, lang, static)
+
+    def load(self, endpoint: str, lang: str = "", static: bool = False) -> Dict:
+        """Load an endpoint from disk and keep it resident."""
+        with self._lock:
+            if static:
+                if endpoint in self.static:
+                    return self.static[endpoint]
+            elif endpoint in self.data.get(lang, {}):
+                return self.data[lang][endpoint]
+
+            data = read_cache_file(endpoint, lang, static)
+            key = "static" if static else lang
+            size = cache_file_size(endpoint, lang, static)
+            self.sizes[key] = self.sizes.get(key, 0) + size
+
+            # replace the dicts instead of adding to them so lock-free readers
+            # never iterate a dict that is being resized
+            if static:
+                self.static = {**self.static, endpoint: data}
+            else:
+                if lang not in self.data:
+                    log.info(f"[Ambr Cache] Language {lang} is now resident")
+                self.data = {**self.data, lang: {**self.data.get(lang, {}), endpoint: data}}
+            return data
+
+    def get_model(self, key: Tuple[str, str, str], build: Callable[[], T]) -> T:
+        """Get a memoized model, building it on a miss.
+
+        Args:
+            key (Tuple[str, str, str]): (lang, endpoint, id) of the model.
+            build (Callable[[], T]): Builds the model, exceptions are raised to the caller and nothing is cached.
+
+        Returns:
+            T: The model.
+        """
+        return self.models.get(key, build)
+
+    def get_derived(self, key: Any, build: Callable[[], T]) -> T:
+        """Get a structure derived from the cache data, building it once per snapshot.
+
+        Args:
+            key (Any): The key of the structure.
+            build (Callable[[], T]): Builds the structure.
+
+        Returns:
+            T: The structure.
+        """
+        try:
+            return self.derived[key]
+        except KeyError:
+            pass
+        with self._derived_lock:
+            if key not in self.derived:
+                self.derived = {**self.derived, key: build()}
+            return self.derived[key]
+
+    def material_users(self) -> Dict[int, MaterialUsers]:
+        """Get an index of material id to the characters and weapons that use it to upgrade."""
+        return self.get_derived("material_users", self._build_material_users)
+
+    def _build_material_users(self) -> Dict[int, MaterialUsers]:
+        index: Dict[int, MaterialUsers] = {}
+        upgrade = self.get("upgrade", static=True).get("data", {})
+        for character_id, upgrade_info in upgrade.get("avatar", {}).items():
+            for material_id in upgrade_info["items"]:
+                users = index.setdefault(int(material_id), MaterialUsers([], []))
+                users.characters.append(character_id)
+        for weapon_id, upgrade_info in upgrade.get("weapon", {}).items():
+            for material_id in upgrade_info["items"]:
+                users = index.setdefault(int(material_id), MaterialUsers([], []))
+                users.weapons.append(int(weapon_id))
+        return index
+
+    def loaded_file_sizes(self) -> Dict[str, int]:
+        """Get the loaded languages and the on-disk size of their loaded cache files in bytes.
+
+        This is not resident memory, binary cache files are memory-mapped and only the
+        records that were accessed are actually resident.
+        """
+        return dict(self.sizes)
+
+    def report(self) -> None:
+        """Log the loaded languages and the model cache stats, then reset the hit and miss counts."""
+        stats = self.models.stats(reset=True)
+        log.info(
+            f"[Ambr Cache] {stats.entries}/{self.models.maxsize} models, {stats.describe_hits()}"
+        )
+        sizes = self.loaded_file_sizes()
+        languages = ", ".join(
+            f"{lang} ({size / 1024 / 1024:.1f} MiB)" for lang, size in sorted(sizes.items())
+        )
+        log.info(
+            f"[Ambr Cache] Snapshot version {self.version}, "
+            f"loaded cache files on disk: {languages or 'none'}"
+        )
+
+    def resident_endpoints(self) -> List[Tuple[str, str]]:
+        """Get a list of (language, endpoint) pairs that are loaded, static endpoints use "static" as their language."""
+        result = [("static", endpoint) for endpoint in self.static]
+        for lang, endpoints in self.data.items():
+            result += [(lang, endpoint) for endpoint in endpoints]
+        return result
+
+
+def build_snapshot(version: int, old: Optional[CacheSnapshot]) -> CacheSnapshot:
+    snapshot = CacheSnapshot(version)
+    if old is not None:
+        # warm the endpoints that were in use so the first request after a reload stays fast
+        for lang, endpoint in old.resident_endpoints():
+            snapshot.load(endpoint, lang, static=lang == "static")
+    return snapshot
+
+
+_snapshot: Reloadable[CacheSnapshot] = Reloadable(build_snapshot)
+
+
+def get_snapshot() -> CacheSnapshot:
+    """Get the current process-wide cache snapshot, loading it on first use."""
+    return _snapshot.get()
+
+
+def reload_snapshot() -> CacheSnapshot:
+    """Build a new snapshot from the files on disk and swap it in.
+
+    The endpoints resident in the old snapshot are loaded before the swap, so readers
+    either see the old data or the new data, never a mix of both.
+    """
+    return _snapshot.reload()
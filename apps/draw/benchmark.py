@@ -0,0 +1,93 @@
+"""Compare global_write on leaderboard rows with drawing glyph by glyph.
+
+Usage (from the repository root):
+    python -m apps.draw.benchmark
+"""
+
+import random
+import string
+import time
+from typing import Dict, List
+
+from fontTools.ttLib import TTFont
+from PIL import Image, ImageDraw, ImageFont
+
+from apps.draw.utility import global_write, has_glyph
+from data.draw.fonts import FONTS
+
+ROWS = 100
+# the size and position of the user name on a leaderboard user card
+CARD_SIZE = (1490, 170)
+NAME_POS = (350, 27)
+NAME_SIZE = 48
+
+
+def glyph_by_glyph_write(
+    draw: ImageDraw.ImageDraw, pos, text: str, size: int, fill: str, variation: str
+):
+    """The previous global_write, which opened every font for every call and drew one glyph at a time."""
+    fonts: Dict[str, TTFont] = {}
+    for val in FONTS.values():
+        path = f"resources/fonts/{val['name']}-{variation}.{val['extension']}"
+        fonts[path] = TTFont(path)
+    prior_font = None
+    for glyph in text:
+        if prior_font is not None and has_glyph(prior_font["font_obj"], glyph):
+            f = ImageFont.truetype(prior_font["font_path"], size=size)
+            draw.text(pos, glyph, fill=fill, font=f)
+            pos = (pos[0] + f.getlength(glyph), pos[1])
+            continue
+        found = False
+        for font_path, ttfont_obj in fonts.items():
+            f = ImageFont.truetype(font_path, size=size)
+            if has_glyph(ttfont_obj, glyph):
+                found = True
+                prior_font = {"font_path": font_path, "font_obj": ttfont_obj}
+                draw.text(pos, glyph, fill=fill, font=f)
+                pos = (pos[0] + f.getlength(glyph), pos[1])
+                break
+        f = ImageFont.truetype(list(fonts.keys())[0], size=size)
+        if not found:
+            draw.text(pos, glyph, fill=fill, font=f)
+            pos = (pos[0] + f.getlength(glyph), pos[1])
+
+
+def user_names(count: int) -> List[str]:
+    random.seed(0)
+    alphabet = string.ascii_letters + string.digits + " _-.★" + "申鶴夜蘭" + "ยินดี" + "シェンヘ"
+    return [
+        "".join(random.choice(alphabet) for _ in range(random.randint(4, 16)))
+        for _ in range(count)
+    ]
+
+
+def render(write, names: List[str]) -> List[bytes]:
+    result = []
+    for name in names:
+        im = Image.new("RGBA", CARD_SIZE, "#F0F0F0")
+        write(ImageDraw.Draw(im), NAME_POS, name, NAME_SIZE, "#212121", "Bold")
+        result.append(im.tobytes())
+    return result
+
+
+def main():
+    names = user_names(ROWS)
+    # the first call builds the coverage index and opens the fonts
+    render(global_write, names[:1])
+
+    start = time.perf_counter()
+    expected = render(glyph_by_glyph_write, names)
+    before = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = render(global_write, names)
+    after = time.perf_counter() - start
+
+    different = sum(a != b for a, b in zip(expected, result))
+    print(f"{ROWS} leaderboard rows, {different} differ from drawing glyph by glyph")
+    print(f"glyph by glyph: {before / ROWS * 1000:.2f}ms per row")
+    print(f"global_write:   {after / ROWS * 1000:.2f}ms per row ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
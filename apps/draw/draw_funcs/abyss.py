@@ -7,6 +7,7 @@ from PIL import Image, ImageDraw
 
 import asset
 from apps.draw.draw_funcs import leaderboard
+from apps.draw.templates import get_template
 from apps.draw.utility import (
     draw_dynamic_background,
     dynamic_font_size,
@@ -33,10 +34,9 @@ def one_page(
     dark_mode: bool,
     user_characters: List[genshin.models.Character],
 ) -> io.BytesIO:
-    app_mode = "dark" if dark_mode else "light"
     font = get_font(locale, 60)
     fill = asset.white if dark_mode else asset.primary_text
-    im = Image.open(f"yelan/templates/abyss/[{app_mode}] Abyss One Page.png")
+    im = get_template("abyss/Abyss One Page", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # write the title
@@ -58,8 +58,7 @@ def one_page(
     most_played = abyss.ranks.most_played[:4]
     offset = (75, 453)
     for character in most_played:
-        icon = get_cache(character.icon)
-        icon = icon.resize((220, 220))
+        icon = get_cache(character.icon, (220, 220))
         icon = icon.crop((28, 0, 192, 220))
         im.paste(icon, offset, icon)
         offset = (offset[0] + 250, offset[1])
@@ -109,8 +108,7 @@ def one_page(
                 font=level_font,
                 anchor="mm",
             )
-        icon = get_cache(character.icon)
-        icon = icon.resize((280, 280))
+        icon = get_cache(character.icon, (280, 280))
         icon = icon.crop((33, 0, 247, 280))
         im.paste(icon, icon_offset, icon)
         offset = (offset[0] + 1009, offset[1])
@@ -131,8 +129,7 @@ def one_page(
                     for index in range(4):
                         try:
                             character = characters[index]
-                            icon = get_cache(character.icon)
-                            icon = icon.resize((129, 129))
+                            icon = get_cache(character.icon, (129, 129))
                             icon = icon.crop((17, 0, 112, 129))
                             im.paste(icon, offset, icon)
                             draw.text(
@@ -164,9 +161,9 @@ def one_page(
     # draw stars
     font = get_font(locale, 30)
     stars = {
-        1: f"yelan/templates/abyss/[{app_mode}] One Star.png",
-        2: f"yelan/templates/abyss/[{app_mode}] Two Star.png",
-        3: f"yelan/templates/abyss/[{app_mode}] Three Star.png",
+        1: "abyss/One Star",
+        2: "abyss/Two Star",
+        3: "abyss/Three Star",
     }
     star_offset = {
         1: (-13, 25),
@@ -183,7 +180,7 @@ def one_page(
             for chamber in floor.chambers:
                 text = f"{floor.floor}-{chamber.chamber}"
                 draw.text(offset, text=text, font=font, fill=fill, anchor="mm")
-                star = Image.open(stars[chamber.stars])
+                star = get_template(stars[chamber.stars], dark_mode)
                 star = star.resize((star.width // 2, star.height // 2))
                 im.paste(
                     star,
@@ -241,9 +238,7 @@ def overview(
     user: genshin.models.PartialGenshinUserStats,
 ) -> io.BytesIO:
     app_mode = "light" if not dark_mode else "dark"
-    card: Image.Image = Image.open(
-        f"yelan/templates/abyss/[{app_mode}] Abyss Overview.png"
-    )
+    card: Image.Image = get_template("abyss/Abyss Overview", dark_mode)
     draw = ImageDraw.Draw(card)
 
     font = get_font(locale, 90)
@@ -269,8 +264,7 @@ def overview(
     most_played = abyss.ranks.most_played[:4]
     offset = (120, 760)
     for character in most_played:
-        icon = get_cache(character.icon)
-        icon = icon.resize((360, 360))
+        icon = get_cache(character.icon, (360, 360))
         icon = icon.crop((45, 0, 320, 360))
         card.paste(icon, offset, icon)
         offset = (offset[0] + 415, offset[1])
@@ -315,8 +309,7 @@ def overview(
                 font=level_font,
                 anchor="mm",
             )
-        icon = get_cache(character.icon)
-        icon = icon.resize((453, 453))
+        icon = get_cache(character.icon, (453, 453))
         icon = icon.crop((65, 0, 400, 453))
         card.paste(icon, icon_offset, icon)
         offset = (offset[0] + 1690, offset[1])
@@ -337,8 +330,7 @@ def floor(
     floor: genshin.models.Floor,
     characters: List[genshin.models.Character],
 ) -> io.BytesIO:
-    app_mode = "dark" if dark_mode else "light"
-    im: Image.Image = Image.open(f"yelan/templates/abyss/[{app_mode}] Abyss Floor.png")
+    im: Image.Image = get_template("abyss/Abyss Floor", dark_mode)
     fill = asset.white if dark_mode else asset.primary_text
     font = get_font("en-US", 28)
     floor_font = get_font("en-US", 45)
@@ -347,15 +339,15 @@ def floor(
     text_offset = (240, 383)
     floor_offset = (1287, 197)
     stars = {
-        1: f"yelan/templates/abyss/[{app_mode}] One Star.png",
-        2: f"yelan/templates/abyss/[{app_mode}] Two Star.png",
-        3: f"yelan/templates/abyss/[{app_mode}] Three Star.png",
+        1: "abyss/One Star",
+        2: "abyss/Two Star",
+        3: "abyss/Three Star",
     }
     star_x_offset = {1: 1267, 2: 1243, 3: 1218}
     star_offset = (0, 231)
     for chamber in floor.chambers:
         star_offset = (star_x_offset[chamber.stars], star_offset[1])
-        star = Image.open(stars.get(chamber.stars, stars[1]))
+        star = get_template(stars.get(chamber.stars, stars[1]), dark_mode)
         im.paste(star, star_offset, star)
         draw.text(
             floor_offset,
@@ -378,8 +370,7 @@ def floor(
                             font=font,
                             anchor="mm",
                         )
-                    icon = get_cache(c.icon)
-                    icon = icon.resize((210, 210))
+                    icon = get_cache(c.icon, (210, 210))
                     icon = icon.crop((20, 0, 190, 210))
                     draw.text(
                         text_offset, f"Lv. {c.level}", fill=fill, font=font, anchor="mm"
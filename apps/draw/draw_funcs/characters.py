@@ -7,6 +7,7 @@ import genshin
 from PIL import Image, ImageDraw
 
 import asset
+from apps.draw.templates import get_template
 from apps.draw.utility import (circular_crop, draw_dynamic_background,
                                dynamic_font_size, get_cache, get_font,
                                shorten_text)
@@ -79,9 +80,7 @@ def s_card(
     locale: str | discord.Locale,
 ) -> Image.Image:
     # card
-    im = Image.open(
-        f"yelan/templates/character/[{'light' if not dark_mode else 'dark'}] card.png"
-    )
+    im = get_template("character/card", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # character icon
@@ -2,9 +2,10 @@ import io
 
 import discord
 import genshin
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 
 import asset
+from apps.draw.templates import get_template
 from apps.draw.utility import circular_crop, get_cache, get_font
 from apps.text_map.text_map_app import text_map
 
@@ -14,9 +15,7 @@ def card(
     locale: discord.Locale | str,
     dark_mode: bool,
 ) -> io.BytesIO:
-    im = Image.open(
-        f"yelan/templates/check/[{'dark' if dark_mode else 'light'}] Check.png"
-    )
+    im = get_template("check/Check", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # title
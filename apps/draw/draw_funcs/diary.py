@@ -6,6 +6,7 @@ import genshin
 from PIL import Image, ImageDraw
 
 import asset
+from apps.draw.templates import get_template
 from apps.draw.utility import get_font, human_format
 from apps.genshin.utils import convert_ar_to_wl, convert_wl_to_mora
 from apps.text_map.text_map_app import text_map
@@ -20,9 +21,7 @@ def card(
     dark_mode: bool,
     plot_io: Optional[io.BytesIO],
 ) -> io.BytesIO:
-    im = Image.open(
-        f"yelan/templates/diary/[{'light' if not dark_mode else 'dark'}] Diary.png"
-    )
+    im = get_template("diary/Diary", dark_mode)
     draw = ImageDraw.Draw(im)
 
     font = get_font(locale, 43, "Bold")
@@ -6,6 +6,7 @@ from PIL import Image, ImageDraw
 
 import asset
 from ambr.models import Character, Domain, Weapon
+from apps.draw.templates import get_template
 from apps.draw.utility import dynamic_font_size, get_cache, get_font
 from apps.genshin.utils import get_domain_title
 
@@ -17,8 +18,8 @@ def draw_domain_card(
 ) -> io.BytesIO:
     # get domain template image
     background_paths = ["", "Mondstat", "Liyue", "Inazuma", "Sumeru"]
-    domain_card: Image.Image = Image.open(
-        f"yelan/templates/farm/{background_paths[domain.city.id]} Farm.png"
+    domain_card: Image.Image = get_template(
+        f"farm/{background_paths[domain.city.id]} Farm"
     )
 
     # draw the domain text
@@ -35,22 +36,20 @@ def draw_domain_card(
             highest_rarity = reward.rarity
             highest_reward = reward
     if highest_reward is not None:
-        icon = get_cache(highest_reward.icon)
-        icon.thumbnail((160, 160))
+        icon = get_cache(highest_reward.icon, (160, 160), thumbnail=True)
         domain_card.paste(icon, (87, 60), icon)
 
     count = 1
     offset = (150, 340)
     for item in items.values():
-        icon = get_cache(item.icon)
-        icon.thumbnail((180, 180))
+        icon = get_cache(item.icon, (180, 180), thumbnail=True)
         domain_card.paste(icon, offset, icon)
 
         # is the character a traveler?
         if "10000007" in str(item.id) and isinstance(item, Character):
             # draw the element of the traveler
-            element_icon: Image.Image = Image.open(
-                f"yelan/templates/elements/{item.element.lower()}.png"
+            element_icon: Image.Image = get_template(
+                f"elements/{item.element.lower()}"
             )
             element_icon.thumbnail((64, 64))
             domain_card.paste(
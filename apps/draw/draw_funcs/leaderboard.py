@@ -1,6 +1,7 @@
 from typing import List, Union
 from PIL import Image, ImageDraw
 from ambr.models import Character
+from apps.draw.templates import get_template
 from apps.draw.utility import (
     circular_crop,
     get_cache,
@@ -34,9 +35,7 @@ def board(
 
     l_type = 2 if current_user is not None and current_user.rank >= 10 else 1
 
-    im: Image.Image = Image.open(
-        f"yelan/templates/leaderboard/[{'dark' if dark_mode else 'light'}] leaderboard_{l_type}.png"
-    )
+    im: Image.Image = get_template(f"leaderboard/leaderboard_{l_type}", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # draw the user cards
@@ -88,9 +87,7 @@ def board(
 
 def user_card(dark_mode: bool, rank: int, current: bool) -> Image.Image:
     """Draw default leaderboard user card."""
-    im = Image.open(
-        f"yelan/templates/leaderboard/[{'light' if not dark_mode else 'dark'}] elevation_{2 if current else 1}.png"
-    )
+    im = get_template(f"leaderboard/elevation_{2 if current else 1}", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # write rank text
@@ -133,8 +130,7 @@ def run_user_card(
     draw.text((63, 84), str(user_data.rank), font=font, fill=fill, anchor="mm")
 
     # draw character icon
-    character_icon = get_cache(user_data.icon_url)
-    character_icon = character_icon.resize((115, 115))
+    character_icon = get_cache(user_data.icon_url, (115, 115))
     character_icon = circular_crop(character_icon)
     im.paste(character_icon, (216, 27), character_icon)
 
@@ -185,8 +181,7 @@ def ss_user_card(
     draw.text((63, 84), str(user_data.rank), font=font, fill=fill, anchor="mm")
 
     # draw character icon
-    character_icon = get_cache(user_data.character.icon)
-    character_icon = character_icon.resize((115, 115))
+    character_icon = get_cache(user_data.character.icon, (115, 115))
     character_icon = circular_crop(character_icon)
     im.paste(character_icon, (216, 27), character_icon)
 
@@ -231,9 +226,7 @@ def c_usage_card(
     locale: str | discord.Locale,
 ) -> Image.Image:
     # card
-    im = Image.open(
-        f"yelan/templates/character/[{'light' if not dark_mode else 'dark'}] card.png"
-    )
+    im = get_template("character/card", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # character icon
@@ -6,6 +6,7 @@ import enkanetwork
 from PIL import Image, ImageChops, ImageDraw
 
 import asset
+from apps.draw.templates import get_template
 from apps.draw.utility import (
     circular_crop,
     draw_dynamic_background,
@@ -32,15 +33,13 @@ def character_card(
 
     # get the template
     if dark_mode:
-        path = f"yelan/templates/build_cards/[dark] {character_id}.png"
         fight_prop_path = "resources/images/fight_props/[dark] "
         color = asset.white
     else:
-        path = f"yelan/templates/build_cards/[light] {character_id}.png"
         fight_prop_path = "resources/images/fight_props/[light] "
         color = asset.primary_text
     try:
-        card: Image.Image = Image.open(path)
+        card: Image.Image = get_template(f"build_cards/{character_id}", dark_mode)
     except FileNotFoundError:
         return None
 
@@ -91,8 +90,7 @@ def character_card(
 
     # draw weapon icon
     weapon = character.equipments[-1]
-    icon = get_cache(weapon.detail.icon.url)
-    icon.thumbnail((200, 200))
+    icon = get_cache(weapon.detail.icon.url, (200, 200), thumbnail=True)
     card.paste(icon, (968, 813), icon)
 
     # write weapon refinement text
@@ -160,8 +158,7 @@ def character_card(
     ):
 
         # draw artifact icons
-        icon = get_cache(artifact.detail.icon.url)
-        icon.thumbnail((180, 180))
+        icon = get_cache(artifact.detail.icon.url, (180, 180), thumbnail=True)
         card.paste(icon, (x_pos, y_pos), icon)
 
         # write artifact level
@@ -214,8 +211,8 @@ def character_card(
 
     if custom_image_url is not None:
         custom_image = crop_custom_character_image(custom_image_url)
-        element = Image.open(
-            f"yelan/templates/element/[{'dark' if dark_mode else 'light'}] {character.element.name}.png"
+        element = get_template(
+            f"element/{character.element.name}", dark_mode
         )
         card.paste(custom_image, (58, 61), custom_image)
         card.paste(element, (1652, 595), element)
@@ -310,13 +307,10 @@ def user_profile_card(
     player: enkanetwork.model.PlayerInfo,
     dark_mode: bool,
 ):
-    im = Image.open(
-        f"yelan/templates/profile/[{'dark' if dark_mode else 'light'}] Profile Card.png"
-    )
+    im = get_template("profile/Profile Card", dark_mode)
 
     # resize and paste the namecard
-    namecard = get_cache(player.namecard.banner.url)
-    namecard = namecard.resize((723, 340))
+    namecard = get_cache(player.namecard.banner.url, (723, 340))
     mask = Image.new("L", namecard.size, 0)
     draw = ImageDraw.Draw(mask)
     draw.rounded_rectangle((0, 0, 723, 340), radius=10, fill=255)
@@ -324,8 +318,7 @@ def user_profile_card(
     im.paste(namecard, (0, 0), namecard)
 
     # draw player icon
-    player_icon = get_cache(player.avatar.icon.url)
-    player_icon = player_icon.resize((183, 183))
+    player_icon = get_cache(player.avatar.icon.url, (183, 183))
     player_icon = circular_crop(player_icon, "#EFEFEF")
     im.paste(player_icon, (42, 231), player_icon)
 
@@ -385,11 +378,8 @@ def user_character_card(
     character: enkanetwork.model.CharacterInfo,
     locale: discord.Locale | str,
 ):
-    im = Image.open(
-        f"yelan/templates/profile/[{'dark' if dark_mode else 'light'}] Character Card.png"
-    )
-    character_icon = get_cache(character.image.icon.url)
-    character_icon = character_icon.resize((115, 115))
+    im = get_template("profile/Character Card", dark_mode)
+    character_icon = get_cache(character.image.icon.url, (115, 115))
     character_icon = circular_crop(character_icon)
     im.paste(character_icon, (115, 19), character_icon)
     draw = ImageDraw.Draw(im)
@@ -409,8 +399,7 @@ def user_character_card(
     for talent in character.skills:
         if talent.id in [10013, 10413]:  # ayaka and mona passive sprint
             continue
-        talent_icon = get_cache(talent.icon.url)
-        talent_icon = talent_icon.resize((36, 36))
+        talent_icon = get_cache(talent.icon.url, (36, 36))
         talent_icon = talent_icon.convert("RGBA")
         mask = Image.new(
             "RGBA",
@@ -6,6 +6,7 @@ from PIL import Image, ImageDraw
 
 import asset
 from ambr.models import Material
+from apps.draw.templates import get_template
 from apps.draw.utility import get_cache, get_font
 from apps.text_map.convert_locale import to_ambr_top
 
@@ -20,15 +21,15 @@ def card(
     fill = asset.primary_text if not dark_mode else asset.white
 
     locale = to_ambr_top(locale)
-    reminder_card: Image.Image = Image.open(
-        f"yelan/templates/remind/[{'dark' if dark_mode else 'light'}] {'Talent' if type =='talent_notification' else 'Weapon'} Notification Card.png"
+    reminder_card: Image.Image = get_template(
+        f"remind/{'Talent' if type =='talent_notification' else 'Weapon'} Notification Card",
+        dark_mode,
     )
     icon_x, icon_y = 100, 100
     count = 1
 
     for mat in materials:
-        icon = get_cache(mat.icon)
-        icon.thumbnail((120, 120))
+        icon = get_cache(mat.icon, (120, 120), thumbnail=True)
         if count == 2:
             icon_y += 210
         elif count == 3:
@@ -7,6 +7,7 @@ import genshin
 from PIL import Image, ImageDraw
 
 import asset
+from apps.draw.templates import get_template
 from apps.draw.utility import circular_crop, get_cache, get_font
 
 
@@ -31,8 +32,7 @@ def card(
         "gold": user_stats.precious_chests,
         "lux": user_stats.luxurious_chests,
     }
-    mode_txt = "dark" if dark_mode else "light"
-    stat_card = Image.open(f"yelan/templates/stats/[{mode_txt}] Stat Card Template.png")
+    stat_card = get_template("stats/Stat Card Template", dark_mode)
     name_card = get_cache(namecard.banner.url)
     w, h = name_card.size
     factor = 2.56
@@ -41,8 +41,7 @@ def card(
     name_card = name_card.crop((0, 190, w, h - 190))
     stat_card.paste(name_card, (112, 96))
 
-    profile_pic = get_cache(pfp.url)
-    profile_pic = profile_pic.resize((412, 412))
+    profile_pic = get_cache(pfp.url, (412, 412))
     profile_pic = circular_crop(profile_pic)
     stat_card.paste(profile_pic, (979, 462), profile_pic)
     draw = ImageDraw.Draw(stat_card)
@@ -69,8 +68,7 @@ def card(
 
 
 def area(explorations: List[genshin.models.Exploration], dark_mode: bool):
-    mode_txt = "dark" if dark_mode else "light"
-    card = Image.open(f"yelan/templates/area/[{mode_txt}] Area Card Template.png")
+    card = get_template("area/Area Card Template", dark_mode)
     card_draw = ImageDraw.Draw(card)
     fill = asset.white if dark_mode else asset.primary_text
     font = get_font("en-US", 90)
@@ -85,7 +83,7 @@ def area(explorations: List[genshin.models.Exploration], dark_mode: bool):
         percentage = exploration.explored
         file_name = f"light_{exploration.id}"
         try:
-            im = Image.open(f"yelan/templates/area/{file_name}.png")
+            im = get_template(f"area/{file_name}")
         except FileNotFoundError:
             continue
         mask = Image.new("L", im.size, 0)
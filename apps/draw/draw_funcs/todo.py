@@ -6,6 +6,7 @@ from PIL import Image, ImageDraw
 
 import asset
 from ambr.models import Material
+from apps.draw.templates import get_template
 from apps.draw.utility import (circular_crop, draw_dynamic_background,
                                dynamic_font_size, get_cache, get_font)
 from apps.genshin.custom_model import DynamicBackgroundInput, TopPadding
@@ -69,9 +70,7 @@ def small_card(
     dark_mode: bool,
     locale: discord.Locale | str,
 ) -> Image.Image:
-    im = Image.open(
-        f"yelan/templates/todo/[{'light' if not dark_mode else 'dark'}] todo.png"
-    )
+    im = get_template("todo/todo", dark_mode)
     draw = ImageDraw.Draw(im)
 
     # material icon
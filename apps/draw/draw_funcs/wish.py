@@ -1,9 +1,10 @@
 import io
 
 import discord
-from PIL import Image, ImageDraw
+from PIL import ImageDraw
 
 import asset
+from apps.draw.templates import get_template
 from apps.draw.utility import (
     circular_crop,
     dynamic_font_size,
@@ -22,9 +23,7 @@ def overview(
     user_name: str,
     dark_mode: bool,
 ) -> io.BytesIO:
-    im = Image.open(
-        f"yelan/templates/wish/[{'light' if not dark_mode else 'dark'}] Wish Overview.png"
-    )
+    im = get_template("wish/Wish Overview", dark_mode)
     draw = ImageDraw.Draw(im)
     fill = asset.primary_text if not dark_mode else asset.white
     locale = str(locale)
@@ -0,0 +1,151 @@
+import math
+import threading
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from cachetools import LRUCache
+from fontTools.ttLib import TTFont
+from PIL import ImageFont
+
+from data.draw.fonts import FONTS
+
+INK_CACHE_SIZE = 65536
+# Pillow draws texts with a newline as multiline text, so these are always drawn alone
+LINE_BREAKS = ("\n", "\r")
+
+
+class FontCoverage:
+    """The fonts of FONTS that have a glyph for each codepoint, for one variation.
+
+    Fonts are in the order of FONTS and each path appears once, the same order
+    global_write tries them in.
+    """
+
+    def __init__(self, variation: str):
+        self.paths: List[str] = []
+        for val in FONTS.values():
+            path = f"resources/fonts/{val['name']}-{variation}.{val['extension']}"
+            if path not in self.paths:
+                self.paths.append(path)
+        # codepoint -> bit mask of the indexes of the fonts that have it
+        self.masks: Dict[int, int] = {}
+        for index, path in enumerate(self.paths):
+            font = TTFont(path, lazy=True)
+            for table in font["cmap"].tables:
+                for codepoint in table.cmap:
+                    self.masks[codepoint] = self.masks.get(codepoint, 0) | (1 << index)
+            font.close()
+
+    def font_indexes(self, text: str) -> List[int]:
+        """Get the index of the font each character of a text is drawn with.
+
+        The font of the previous character is kept while it has the glyph, otherwise
+        the first font that has it is used. Characters no font has are drawn with the
+        first font and don't change the font of the next character.
+        """
+        result = []
+        prior: Optional[int] = None
+        for char in text:
+            mask = self.masks.get(ord(char), 0)
+            if prior is not None and mask >> prior & 1:
+                result.append(prior)
+            elif mask:
+                prior = (mask & -mask).bit_length() - 1
+                result.append(prior)
+            else:
+                result.append(0)
+        return result
+
+
+_coverages: Dict[str, FontCoverage] = {}
+_coverage_lock = threading.Lock()
+
+
+def get_coverage(variation: str) -> FontCoverage:
+    coverage = _coverages.get(variation)
+    if coverage is not None:
+        return coverage
+    with _coverage_lock:
+        if variation not in _coverages:
+            _coverages[variation] = FontCoverage(variation)
+        return _coverages[variation]
+
+
+_ink: LRUCache[Tuple[str, int, str], Optional[Tuple[int, int]]] = LRUCache(maxsize=INK_CACHE_SIZE)
+_ink_lock = threading.Lock()
+
+
+def ink_extent(font: ImageFont.FreeTypeFont, char: str) -> Optional[Tuple[int, int]]:
+    """Get the columns a character inks relative to its origin, None if it inks nothing."""
+    key = (str(font.path), font.size, char)
+    with _ink_lock:
+        if key in _ink:
+            return _ink[key]
+    mask, offset = font.getmask2(char, "L")
+    bbox = mask.getbbox()
+    extent = None if bbox is None else (offset[0] + bbox[0], offset[0] + bbox[2])
+    with _ink_lock:
+        _ink[key] = extent
+    return extent
+
+
+class TextRun(NamedTuple):
+    text: str
+    font_index: int
+    x: float
+
+
+def split_runs(
+    text: str, font_indexes: List[int], fonts: List[ImageFont.FreeTypeFont], x: float = 0
+) -> List[TextRun]:
+    """Split a text into runs that can each be drawn with one draw call.
+
+    A run has one font. Pillow merges the glyphs of a run into one mask before
+    blending it, while drawing glyphs one by one blends antialiased pixels twice
+    where glyphs touch. A run is split wherever the ink of the next glyph could
+    share a column with the ink before it, so drawing the runs gives the same
+    pixels as drawing every glyph on its own.
+
+    Kerning and shaping would also make runs differ, so glyphs of fonts that don't
+    use basic layout are never merged.
+
+    Args:
+        text (str): The text.
+        font_indexes (List[int]): The index of the font of each character, from FontCoverage.font_indexes.
+        fonts (List[ImageFont.FreeTypeFont]): The fonts, in the order of FontCoverage.paths.
+        x (float, optional): The x position of the text. Defaults to 0.
+
+    Returns:
+        List[TextRun]: The runs and their x positions.
+    """
+    runs: List[TextRun] = []
+    run_text = ""
+    run_x = x
+    run_font = -1
+    run_right = -math.inf
+    for char, font_index in zip(text, font_indexes):
+        font = fonts[font_index]
+        extent = None if char in LINE_BREAKS else ink_extent(font, char)
+        # the fractional start of a glyph can move its ink by a column
+        left = math.floor(x) + extent[0] - 1 if extent is not None else math.inf
+        if (
+            run_text
+            and font_index == run_font
+            and font.layout_engine == ImageFont.Layout.BASIC
+            and char not in LINE_BREAKS
+            and run_text[-1] not in LINE_BREAKS
+            and run_right <= left
+        ):
+            run_text += char
+        else:
+            if run_text:
+                runs.append(TextRun(run_text, run_font, run_x))
+            run_text = char
+            run_x = x
+            run_font = font_index
+            run_right = -math.inf
+        if extent is not None:
+            run_right = max(run_right, math.floor(x) + extent[1] + 1)
+        x += font.getlength(char)
+    if run_text:
+        runs.append(TextRun(run_text, run_font, run_x))
+    return runs
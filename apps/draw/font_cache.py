@@ -0,0 +1,92 @@
+import os
+from typing import Iterable, NamedTuple, Tuple
+
+from PIL import ImageFont
+
+from utility.loading_cache import CacheStats, LoadingCache
+from utility.utils import log
+
+FONT_CACHE_SIZE = 256
+
+# the (size, variation) pairs the draw functions use the most, loaded for every locale font at startup
+COMMON_FONTS: Tuple[Tuple[int, str], ...] = (
+    (20, "Regular"),
+    (24, "Regular"),
+    (25, "Regular"),
+    (30, "Regular"),
+    (36, "Regular"),
+    (36, "Medium"),
+    (36, "Bold"),
+    (40, "Regular"),
+    (40, "Medium"),
+    (40, "Bold"),
+    (50, "Regular"),
+    (75, "Regular"),
+    (75, "Bold"),
+)
+
+
+class FontCacheStats(NamedTuple):
+    cache: CacheStats
+    files: int
+    file_bytes: int
+    """The size of the distinct font files, the fonts of a file share its memory-mapped pages"""
+
+
+class FontCache:
+    """A bounded cache of FreeType fonts keyed by (font path, size).
+
+    Fonts are shared between threads, so callers must not mutate them (font_variant
+    returns a new font and is fine). Pillow holds the GIL while it renders with a font,
+    so draw functions running in executor threads can use the same font.
+    """
+
+    def __init__(self, maxsize: int = FONT_CACHE_SIZE):
+        self._fonts: LoadingCache[Tuple[str, int], ImageFont.FreeTypeFont] = LoadingCache(maxsize)
+
+    def get(self, path: str, size: int) -> ImageFont.FreeTypeFont:
+        return self._fonts.get((path, size), lambda: ImageFont.truetype(path, size))
+
+    def warm(self, fonts: Iterable[Tuple[str, int]]) -> int:
+        """Open fonts ahead of time, missing font files are skipped.
+
+        Args:
+            fonts (Iterable[Tuple[str, int]]): The (font path, size) pairs to open.
+
+        Returns:
+            int: The number of fonts opened.
+        """
+        count = 0
+        for path, size in fonts:
+            if (path, size) in self._fonts:
+                continue
+            try:
+                self.get(path, size)
+            except OSError:
+                continue
+            count += 1
+        return count
+
+    def stats(self, reset: bool = False) -> FontCacheStats:
+        cache = self._fonts.stats(reset)
+        paths = {path for path, _ in self._fonts.keys()}
+        file_bytes = 0
+        for path in paths:
+            try:
+                file_bytes += os.path.getsize(path)
+            except OSError:
+                pass
+        return FontCacheStats(cache, len(paths), file_bytes)
+
+    def report(self) -> FontCacheStats:
+        """Log the cache stats and reset the hit and miss counts."""
+        stats = self.stats(reset=True)
+        log.info(
+            f"[Font Cache] {stats.cache.entries} fonts from {stats.files} files "
+            f"({stats.file_bytes / 1024 / 1024:.1f} MiB), {stats.cache.describe_hits()}"
+        )
+        return stats
+
+
+font_cache = FontCache()
+
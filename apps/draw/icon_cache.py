@@ -0,0 +1,78 @@
+from typing import Iterable, Optional, Tuple
+
+from PIL import Image
+
+from apps.draw.image_cache import ImageCache, open_image
+from utility.loading_cache import CacheStats
+from utility.utils import log
+
+ICON_CACHE_BYTES = 128 * 1024 * 1024
+
+
+class IconCache:
+    """Decoded images of apps/draw/cache, bounded by the size of their pixels.
+
+    Images are keyed by (file name, size, thumbnail) and stored already resized, so
+    drawing the same icon at the same size again skips decoding and resampling.
+    Copies are handed out, so callers can modify them.
+    """
+
+    def __init__(self, max_bytes: int = ICON_CACHE_BYTES):
+        self._icons = ImageCache(max_bytes)
+
+    @staticmethod
+    def _decode(
+        file_name: str, size: Optional[Tuple[int, int]], thumbnail: bool
+    ) -> Image.Image:
+        im = open_image("apps/draw/cache/" + file_name)
+        if size is not None:
+            if thumbnail:
+                im.thumbnail(size)
+            else:
+                im = im.resize(size)
+        return im
+
+    def get(
+        self, file_name: str, size: Optional[Tuple[int, int]] = None, thumbnail: bool = False
+    ) -> Image.Image:
+        """Get a copy of a cached image.
+
+        Args:
+            file_name (str): The file name in apps/draw/cache.
+            size (Optional[Tuple[int, int]], optional): Resize the image to this size. Defaults to None, which keeps the original size.
+            thumbnail (bool, optional): Fit the image in the size keeping its aspect ratio, like Image.thumbnail. Defaults to False.
+
+        Raises:
+            FileNotFoundError: The image isn't downloaded.
+
+        Returns:
+            Image.Image: A copy of the image.
+        """
+        im = self._icons.get(
+            (file_name, size, thumbnail), lambda: self._decode(file_name, size, thumbnail)
+        )
+        return im.copy()
+
+    def discard(self, file_names: Iterable[str]) -> int:
+        """Remove the cached images of files, such as files evicted from apps/draw/cache.
+
+        Returns:
+            int: The number of cached images removed.
+        """
+        file_names = set(file_names)
+        return self._icons.discard(lambda key: key[0] in file_names)
+
+    def stats(self) -> CacheStats:
+        return self._icons.stats()
+
+    def report(self) -> CacheStats:
+        """Log the cache stats and reset the hit and miss counts."""
+        stats = self._icons.stats(reset=True)
+        log.info(
+            f"[Icon Cache] {stats.entries} icons ({stats.size / 1024 / 1024:.1f} MiB), "
+            f"{stats.describe_hits()}"
+        )
+        return stats
+
+
+icon_cache = IconCache()
@@ -0,0 +1,24 @@
+from typing import Hashable
+
+from PIL import Image
+
+from utility.loading_cache import LoadingCache
+
+
+def image_size(im: Image.Image) -> int:
+    """Get the approximate number of bytes of an image's pixels."""
+    return im.width * im.height * len(im.getbands())
+
+
+def open_image(path: str) -> Image.Image:
+    """Decode an image completely, so the file is closed before it is returned."""
+    with Image.open(path) as f:
+        f.load()
+        return f.copy()
+
+
+class ImageCache(LoadingCache[Hashable, Image.Image]):
+    """Decoded images bounded by the size of their pixels instead of their count."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(max_bytes, getsizeof=image_size)
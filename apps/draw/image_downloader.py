@@ -0,0 +1,195 @@
+import asyncio
+import functools
+import io
+import os
+import uuid
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional
+
+import aiofiles
+import aiohttp
+from PIL import Image
+
+from apps.draw.icon_cache import icon_cache
+from utility.utils import log
+
+CACHE_PATH = "apps/draw/cache"
+CACHE_BUDGET_BYTES = 1024 * 1024 * 1024
+MAX_CONCURRENT_DOWNLOADS = 8
+# files in the cache folder that are not images
+IGNORED_FILES = (".gitkeep",)
+
+
+def validate_image(data: bytes) -> None:
+    """Raise an exception if data doesn't decode as an image."""
+    with Image.open(io.BytesIO(data)) as im:
+        im.load()
+
+
+def remove_files(paths: Iterable[str]) -> None:
+    """Remove files, files that don't exist are skipped."""
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class ImageDownloader:
+    """Downloads images into apps/draw/cache.
+
+    Missing images are downloaded concurrently, and a request for an image that is
+    already being downloaded waits for that download instead of starting another.
+    Images are validated before they are moved into place, so the cache never has
+    truncated files. Files are evicted in least recently used order once the cache
+    is larger than its budget, an image is used when download_images is called with it.
+
+    All methods run on the event loop, so the index of the cache needs no lock. The
+    scan of the folder and file removals run in an executor, moving a download into
+    place and evicting hold a lock so a download isn't removed by an eviction that
+    started before it.
+    """
+
+    def __init__(
+        self,
+        path: str = CACHE_PATH,
+        budget: int = CACHE_BUDGET_BYTES,
+        concurrency: int = MAX_CONCURRENT_DOWNLOADS,
+    ):
+        self.path = path
+        self.budget = budget
+        self.semaphore = asyncio.Semaphore(concurrency)
+        # file name -> size, least recently used first
+        self._files: Optional[OrderedDict[str, int]] = None
+        self._scanning: Optional[asyncio.Future] = None
+        self._size = 0
+        self._lock = asyncio.Lock()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    def _scan(self) -> OrderedDict[str, int]:
+        """Index the cache folder, files are ordered by modification time. This blocks."""
+        entries = []
+        os.makedirs(self.path, exist_ok=True)
+        for entry in os.scandir(self.path):
+            if not entry.is_file() or entry.name in IGNORED_FILES:
+                continue
+            if entry.name.endswith(".tmp"):
+                # left behind by a download that was interrupted
+                os.remove(entry.path)
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, entry.name, stat.st_size))
+        entries.sort()
+        return OrderedDict((name, size) for _, name, size in entries)
+
+    async def _index(self) -> OrderedDict[str, int]:
+        """Get the index of the cache folder, scanning the folder in an executor the first time."""
+        if self._files is None:
+            if self._scanning is None:
+                self._scanning = asyncio.get_running_loop().run_in_executor(None, self._scan)
+            # every caller waits for the same scan, cancelling one caller must not stop it
+            files = await asyncio.shield(self._scanning)
+            if self._files is None:
+                self._files = files
+                self._size = sum(files.values())
+        return self._files
+
+    async def _download(self, url: str, file_name: str, session: aiohttp.ClientSession) -> None:
+        async with self.semaphore:
+            async with session.get(url) as resp:
+                if resp.status != 200:
+                    log.warning(f"[Image Downloader] {url} returned {resp.status}")
+                    return
+                data = await resp.read()
+
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, validate_image, data)
+        except Exception as e:
+            log.warning(f"[Image Downloader] {url} is not a valid image: {e}")
+            return
+
+        path = os.path.join(self.path, file_name)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                await f.write(data)
+            async with self._lock:
+                await loop.run_in_executor(None, os.replace, tmp_path, path)
+                files = await self._index()
+                self._size += len(data) - files.pop(file_name, 0)
+                files[file_name] = len(data)
+        finally:
+            # the temporary file is gone unless the write or the replace failed
+            await loop.run_in_executor(None, remove_files, (tmp_path,))
+
+    def _done(self, file_name: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(file_name, None)
+        # retrieve the exception so a download nobody waits for anymore doesn't warn
+        if not task.cancelled():
+            task.exception()
+
+    async def download(self, url: str, file_name: str, session: aiohttp.ClientSession) -> None:
+        """Download an image unless it is already being downloaded, then wait for the download."""
+        task = self._in_flight.get(file_name)
+        if task is None:
+            task = asyncio.create_task(self._download(url, file_name, session))
+            self._in_flight[file_name] = task
+            task.add_done_callback(functools.partial(self._done, file_name))
+        # shielded so a cancelled request doesn't cancel a download other requests wait for
+        await asyncio.shield(task)
+
+    async def download_images(
+        self, urls: Dict[str, str], session: aiohttp.ClientSession
+    ) -> None:
+        """Download the images that are not in the cache and mark all of them as used.
+
+        Args:
+            urls (Dict[str, str]): File name to the url of the image.
+            session (aiohttp.ClientSession): The session to download with.
+        """
+        files = await self._index()
+        missing: Dict[str, str] = {}
+        for file_name, url in urls.items():
+            if file_name in files:
+                files.move_to_end(file_name)
+            else:
+                missing[file_name] = url
+        try:
+            await asyncio.gather(
+                *(self.download(url, file_name, session) for file_name, url in missing.items())
+            )
+        finally:
+            await self.evict()
+
+    async def evict(self) -> int:
+        """Remove the least recently used files until the cache fits in its budget.
+
+        The decoded images of the removed files are dropped from the icon cache.
+
+        Returns:
+            int: The number of files removed.
+        """
+        async with self._lock:
+            files = await self._index()
+            evicted: List[str] = []
+            while self._size > self.budget and len(files) > 1:
+                file_name, size = files.popitem(last=False)
+                self._size -= size
+                evicted.append(file_name)
+            if not evicted:
+                return 0
+            await asyncio.get_running_loop().run_in_executor(
+                None,
+                remove_files,
+                [os.path.join(self.path, file_name) for file_name in evicted],
+            )
+        icon_cache.discard(evicted)
+        log.info(
+            f"[Image Downloader] Evicted {len(evicted)} images, "
+            f"{self._size / 1024 / 1024:.1f} MiB in {len(files)} images left"
+        )
+        return len(evicted)
+
+
+image_downloader = ImageDownloader()
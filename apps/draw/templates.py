@@ -0,0 +1,119 @@
+import os
+from typing import Iterable, Optional
+
+from dotenv import load_dotenv
+from PIL import Image
+
+from apps.draw.image_cache import ImageCache, open_image
+from utility.loading_cache import CacheStats
+from utility.utils import log
+
+load_dotenv()
+
+# TEMPLATE_CACHE_MB caps the decoded templates, the least recently drawn are dropped once it is reached
+TEMPLATE_CACHE_BYTES = int(os.getenv("TEMPLATE_CACHE_MB", "64")) * 1024 * 1024
+
+# the templates drawn the most, decoded at startup by warm_templates
+COMMON_TEMPLATES = (
+    "leaderboard/elevation_1",
+    "leaderboard/elevation_2",
+    "check/Check",
+    "diary/Diary",
+    "abyss/Abyss Overview",
+    "abyss/Abyss Floor",
+    "abyss/One Star",
+    "abyss/Two Star",
+    "abyss/Three Star",
+    "profile/Profile Card",
+    "profile/Character Card",
+    "character/card",
+)
+
+
+def template_path(name: str, dark_mode: Optional[bool] = None) -> str:
+    """Get the path of a template.
+
+    Args:
+        name (str): The path of the template in yelan/templates without the extension, such as check/Check.
+        dark_mode (Optional[bool], optional): The mode of the template, which prefixes the file name with [dark] or [light]. Defaults to None, for templates that have one mode.
+
+    Returns:
+        str: The path of the template.
+    """
+    folder, _, file_name = name.rpartition("/")
+    if dark_mode is not None:
+        file_name = f"[{'dark' if dark_mode else 'light'}] {file_name}"
+    return f"yelan/templates/{folder}/{file_name}.png"
+
+
+class TemplateCache:
+    """Decoded templates keyed by (name, dark mode), bounded by the size of their pixels.
+
+    The cached images are never handed out, get returns a copy that callers can draw on.
+    """
+
+    def __init__(self, max_bytes: int = TEMPLATE_CACHE_BYTES):
+        self._templates = ImageCache(max_bytes)
+
+    def _load(self, name: str, dark_mode: Optional[bool]) -> Image.Image:
+        return self._templates.get(
+            (name, dark_mode), lambda: open_image(template_path(name, dark_mode))
+        )
+
+    def get(self, name: str, dark_mode: Optional[bool] = None) -> Image.Image:
+        """Get a copy of a decoded template.
+
+        Args:
+            name (str): The path of the template in yelan/templates without the extension, such as check/Check.
+            dark_mode (Optional[bool], optional): The mode of the template. Defaults to None, for templates that have one mode.
+
+        Raises:
+            FileNotFoundError: The template doesn't exist.
+
+        Returns:
+            Image.Image: A copy of the template.
+        """
+        return self._load(name, dark_mode).copy()
+
+    def warm(self, names: Iterable[str]) -> int:
+        """Decode the light and dark mode of templates ahead of time, missing templates are skipped.
+
+        Returns:
+            int: The number of templates decoded.
+        """
+        count = 0
+        for name in names:
+            for dark_mode in (False, True):
+                try:
+                    self._load(name, dark_mode)
+                except FileNotFoundError:
+                    continue
+                count += 1
+        return count
+
+    def stats(self) -> CacheStats:
+        return self._templates.stats()
+
+    def report(self) -> CacheStats:
+        """Log the cache stats and reset the hit and miss counts."""
+        stats = self._templates.stats(reset=True)
+        log.info(
+            f"[Template Cache] {stats.entries} templates "
+            f"({stats.size / 1024 / 1024:.1f} MiB), {stats.describe_hits()}"
+        )
+        return stats
+
+
+template_cache = TemplateCache()
+
+
+def get_template(name: str, dark_mode: Optional[bool] = None) -> Image.Image:
+    """Get a copy of a decoded template, see TemplateCache.get."""
+    return template_cache.get(name, dark_mode)
+
+
+def warm_templates() -> int:
+    """Decode the common templates, run by the bot at startup in an executor."""
+    count = template_cache.warm(COMMON_TEMPLATES)
+    log.info(f"[Template Cache] Warmed {count} templates")
+    return count
@@ -1,10 +1,8 @@
 import math
-import os
 import time
 import asset
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from typing import Any, List, Literal, Optional, Tuple
 from apps.text_map.text_map_app import text_map
-import aiofiles
 import aiohttp
 import discord
 import diskcache
@@ -12,7 +10,12 @@ import genshin
 from PIL import Image, ImageDraw, ImageFont
 from fontTools.ttLib import TTFont
 from fontTools.unicode import Unicode
+from apps.draw.fallback_text import TextRun, get_coverage, split_runs
+from apps.draw.font_cache import COMMON_FONTS, font_cache
+from apps.draw.icon_cache import icon_cache
+from apps.draw.image_downloader import image_downloader
 from apps.genshin.custom_model import DynamicBackgroundInput
+from apps.text_map.convert_locale import LOCALES, get_locale_info
 from data.draw.fonts import FONTS
 from utility.utils import default_embed, log
 
@@ -34,20 +37,21 @@ def extract_urls(objects: List[Any]) -> List[str]:
 
 
 async def download_images(urls: List[str], session: aiohttp.ClientSession) -> None:
-    """Download images from urls."""
-    for url in urls:
-        file_name = extract_file_name(url)
-        if os.path.exists("apps/draw/cache/" + file_name):
-            continue
-        async with session.get(url) as resp:
-            if resp.status == 200:
-                async with aiofiles.open("apps/draw/cache/" + file_name, "wb") as f:
-                    await f.write(await resp.read())
+    """Download images from urls, see ImageDownloader."""
+    await image_downloader.download_images(
+        {extract_file_name(url): url for url in urls}, session
+    )
 
 
-def get_cache(url: str) -> Image.Image:
-    """Get a cached image file from url."""
-    return Image.open("apps/draw/cache/" + extract_file_name(url))
+def get_cache(
+    url: str, size: Optional[Tuple[int, int]] = None, thumbnail: bool = False
+) -> Image.Image:
+    """Get a cached image file from url, optionally resized.
+
+    Resizing here instead of after the call lets the resized image be cached too.
+    See IconCache.get for the arguments.
+    """
+    return icon_cache.get(extract_file_name(url), size, thumbnail)
 
 
 def calculate_time(func):
@@ -119,6 +123,11 @@ def shorten_text(text: str, max_length: int, font: ImageFont.FreeTypeFont) -> st
         return text[: int(max_length // font.getlength("..."))] + "..."
 
 
+DEFAULT_FONT = {"extension": "ttf", "name": "NotoSans"}
+# the font of each locale, indexed by LocaleInfo.id
+LOCALE_FONTS = [FONTS.get(info.key, DEFAULT_FONT) for info in LOCALES]
+
+
 def get_font_name(
     locale: discord.Locale | str,
     variation: Literal[
@@ -126,16 +135,12 @@ def get_font_name(
     ] = "Regular",
 ) -> str:
     """Get a font name from the font folder."""
-    path = "resources/fonts/"
-    default = {"extension": "ttf", "name": "NotoSans"}
-    return (
-        path
-        + FONTS.get(str(locale), default)["name"]
-        + "-"
-        + variation
-        + "."
-        + FONTS.get(str(locale), default)["extension"]
-    )
+    font = LOCALE_FONTS[get_locale_info(locale).id]
+    return font_path(font["name"], font["extension"], variation)
+
+
+def font_path(name: str, extension: str, variation: str) -> str:
+    return "resources/fonts/" + name + "-" + variation + "." + extension
 
 
 def get_font(
@@ -145,9 +150,22 @@ def get_font(
         "Bold", "Light", "Thin", "Black", "Medium", "Regular"
     ] = "Regular",
 ) -> ImageFont.FreeTypeFont:
-    """Get a font"""
+    """Get a font, fonts are cached and shared so don't mutate them"""
     font_name = get_font_name(locale, variation)
-    return ImageFont.truetype(font_name, size)
+    return font_cache.get(font_name, size)
+
+
+def warm_font_cache() -> int:
+    """Open the common fonts of every locale, run by the bot at startup in an executor."""
+    start = time.perf_counter()
+    fonts = {(font["name"], font["extension"]) for font in LOCALE_FONTS + [DEFAULT_FONT]}
+    count = font_cache.warm(
+        (font_path(name, extension, variation), size)
+        for name, extension in sorted(fonts)
+        for size, variation in COMMON_FONTS
+    )
+    log.info(f"[Font Cache] Warmed {count} fonts in {time.perf_counter() - start:.2f}s")
+    return count
 
 
 def get_l_character_data(uuid: str) -> genshin.models.Character:
@@ -216,39 +234,26 @@ def global_write(
     variation: str = "Regular",
     anchor: Optional[str] = None,
 ):
-    """Write a piece of text with the proper fonts"""
-    # load fonts
-    fonts: Dict[str, TTFont] = {}
-    for val in FONTS.values():
-        path = f"resources/fonts/{val['name']}-{variation}.{val['extension']}"
-        fonts[path] = TTFont(path)
-
-    # prior font is the font that was used for the previous glyph
-    prior_font = None
-    for glyph in text:
-        # try to use the prior font
-        if prior_font is not None and has_glyph(prior_font["font_obj"], glyph):
-            f = ImageFont.truetype(prior_font["font_path"], size=size)
-            draw.text(pos, glyph, fill=fill, anchor=anchor, font=f)
-            pos = (pos[0] + f.getlength(glyph), pos[1])
-            continue
-
-        # prior font doesn't have the glyph, find a font that does
-        found = False
-        for font_path, ttfont_obj in fonts.items():
-            f = ImageFont.truetype(font_path, size=size)
-            if has_glyph(ttfont_obj, glyph):
-                found = True
-                prior_font = {"font_path": font_path, "font_obj": ttfont_obj}
-                draw.text(pos, glyph, fill=fill, anchor=anchor, font=f)
-                pos = (pos[0] + f.getlength(glyph), pos[1])
-                break
-
-        # sadly none of our fonts have the glyph, write the sad square
-        f = ImageFont.truetype(list(fonts.keys())[0], size=size)
-        if not found:
-            draw.text(pos, glyph, fill=fill, anchor=anchor, font=f)
-            pos = (pos[0] + f.getlength(glyph), pos[1])
+    """Write a piece of text with the proper fonts
+
+    Each character uses the font of the previous character if it has the glyph,
+    otherwise the first font in FONTS that has it. Consecutive characters with the
+    same font are drawn in one call where that gives the same pixels, see split_runs.
+    """
+    coverage = get_coverage(variation)
+    fonts = [font_cache.get(path, size) for path in coverage.paths]
+    font_indexes = coverage.font_indexes(text)
+    if anchor is None:
+        runs = split_runs(text, font_indexes, fonts, pos[0])
+    else:
+        # anchors place every glyph on its own, so runs would move the glyphs
+        runs = []
+        x = pos[0]
+        for char, font_index in zip(text, font_indexes):
+            runs.append(TextRun(char, font_index, x))
+            x += fonts[font_index].getlength(char)
+    for run in runs:
+        draw.text((run.x, pos[1]), run.text, fill=fill, anchor=anchor, font=fonts[run.font_index])
 
 
 def has_glyph(font: TTFont, glyph: str):
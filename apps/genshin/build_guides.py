@@ -0,0 +1,133 @@
+from typing import Dict, List, NamedTuple, Optional
+
+import yaml
+
+from apps.text_map.cond_text import cond_text
+from apps.text_map.text_map_app import text_map
+from apps.text_map.yaml_cache import load_yaml
+from data.game.elements import get_element_list
+from utility.reloadable import Reloadable
+from utility.utils import log
+
+
+class Build(NamedTuple):
+    """One suggested build of a character, with its names already resolved."""
+
+    weapon: str
+    """The zh-TW name of the weapon"""
+    weapon_id: int
+    artifacts: str
+    """The cond text key of the artifact set"""
+    artifact_texts: Dict[str, str]
+    """The artifact set text in each cond text language"""
+    main_stats: str
+    talents: str
+    talent_levels: List[int]
+    stats: Dict[str, str]
+    move: str
+    dmg: str
+
+
+class CharacterBuilds(NamedTuple):
+    character_id: int
+    name: str
+    """The zh-TW name of the character, used as the cond text key prefix"""
+    element: str
+    builds: List[Build]
+    thoughts: List[str]
+
+
+class BuildGuides(NamedTuple):
+    version: int
+    elements: Dict[str, Dict[int, CharacterBuilds]]
+    """Element (such as Anemo) to character id to builds, in the order of data/builds.
+    The traveler has builds in every element, so always look up characters by element when you can."""
+
+    def get(self, character_id: str | int, element: Optional[str] = None) -> Optional[CharacterBuilds]:
+        """Get the builds of a character.
+
+        Args:
+            character_id (str | int): The character id, a traveler id with an element suffix (10000005-anemo) selects that element.
+            element (Optional[str], optional): The element of the builds. Defaults to None, which searches every element.
+
+        Returns:
+            Optional[CharacterBuilds]: The builds, None if the character has no build guide.
+        """
+        id_str, _, suffix = str(character_id).partition("-")
+        element = element or suffix or None
+        for element_name, characters in self.elements.items():
+            if element is not None and element_name.lower() != element.lower():
+                continue
+            builds = characters.get(int(id_str))
+            if builds is not None:
+                return builds
+        return None
+
+
+def parse_build(build: Dict) -> Build:
+    weapon = text_map.find_item(build["weapon"], "weapon")
+    if weapon is None:
+        raise ValueError(f"Unknown weapon {build['weapon']}")
+    return Build(
+        weapon=build["weapon"],
+        weapon_id=weapon.id,
+        artifacts=build["artifacts"],
+        artifact_texts={
+            lang: cond_text.get_text(lang, "build", build["artifacts"])
+            for lang in cond_text.data
+        },
+        main_stats=build["main_stats"],
+        talents=build["talents"],
+        talent_levels=[int(talent) for talent in str(build["talents"]).split("/")],
+        stats={stat: str(value) for stat, value in build["stats"].items()},
+        move=build["move"],
+        dmg=str(build["dmg"]),
+    )
+
+
+def load_build_guides(version: int) -> BuildGuides:
+    elements: Dict[str, Dict[int, CharacterBuilds]] = {}
+    for element in get_element_list():
+        try:
+            data = load_yaml(f"data/builds/{element.lower()}.yaml", yaml.full_load)
+        except FileNotFoundError:
+            data = {}
+        characters: Dict[int, CharacterBuilds] = {}
+        for character_name, character_builds in (data or {}).items():
+            character = text_map.find_item(character_name, "character")
+            if character is None:
+                log.warning(f"[Build Guides] Unknown character {character_name}")
+                continue
+            character_id = character.id
+            try:
+                builds = [parse_build(build) for build in character_builds["builds"]]
+            except ValueError as e:
+                log.warning(f"[Build Guides][{character_name}] {e}")
+                continue
+            characters[character_id] = CharacterBuilds(
+                character_id=character_id,
+                name=character_name,
+                element=element,
+                builds=builds,
+                thoughts=character_builds.get("thoughts", []),
+            )
+        elements[element] = characters
+    return BuildGuides(version=version, elements=elements)
+
+
+_build_guides: Reloadable[BuildGuides] = Reloadable(
+    lambda version, _: load_build_guides(version)
+)
+
+
+def get_build_guides() -> BuildGuides:
+    """Get the current build guides, loading them on first use."""
+    return _build_guides.get()
+
+
+def reload_build_guides() -> BuildGuides:
+    """Parse the build YAML files again and swap the guides in.
+
+    Weapon and character names are resolved with the text map, so reload it first.
+    """
+    return _build_guides.reload()
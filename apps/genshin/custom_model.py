@@ -217,6 +217,7 @@ class CharacterResult(BaseModel):
 class CharacterBuild(BaseModel):
     embed: discord.Embed
     weapon: Optional[str] = None
+    weapon_id: Optional[int] = None
     artifact: Optional[str] = None
     is_thought: bool
 
@@ -2,17 +2,16 @@ import asyncio
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Literal, Optional, Tuple
 
-import aiohttp
 import aiosqlite
 import discord
 import enkanetwork
 import genshin
-import yaml
 from discord.utils import format_dt
 from diskcache import FanoutCache
 
 from ambr.client import AmbrTopAPI
 from ambr.models import Character, Domain, Weapon
+from apps.genshin.build_guides import get_build_guides, reload_build_guides
 from apps.genshin.custom_model import (CharacterBuild, EnkanetworkData,
                                        FightProp, ShenheBot, ShenheUser,
                                        WishInfo)
@@ -21,10 +20,8 @@ from apps.text_map.convert_locale import to_ambr_top, to_enka, to_genshin_py
 from apps.text_map.text_map_app import text_map
 from apps.text_map.utils import (get_user_locale, get_weekday_name,
                                  translate_main_stat)
-from data.game.artifact_map import artifact_map
-from data.game.character_map import character_map
 from data.game.fight_prop import fight_prop
-from data.game.weapon_map import weapon_map
+from data.game.game_maps import get_game_maps, reload_game_maps
 from utility.utils import (default_embed, divide_chunks, divide_dict,
                            error_embed, get_dt_now)
 
@@ -48,41 +45,41 @@ def calculate_artifact_score(substats: dict):
     return result
 
 def get_character_builds(
-    character_id: str, element_builds_dict: dict, locale: discord.Locale | str
+    character_id: str, element: str, locale: discord.Locale | str
 ) -> List[CharacterBuild]:
     """Gets a character's builds
 
     Args:
-        character_id (int): the id of the character
-        element_builds_dict (dict): the dictionary of all characters of a given element, this is stored in data/builds
+        character_id (str): the id of the character
+        element (str): the element of the builds, such as Anemo
         locale (Locale): the discord locale
-        user_locale (str): the user locale
 
     Returns:
         List[CharacterBuild]
     """
-    character_name = text_map.get_character_name(character_id, "zh-TW")
+    character_builds = get_build_guides().get(character_id, element)
+    if character_builds is None:
+        return []
+    character_name = character_builds.name
     translated_character_name = text_map.get_character_name(character_id, locale)
+    cond_lang = cond_text.get_lang(str(locale))
     count = 1
     result = []
 
-    for build in element_builds_dict[character_name]["builds"]:
+    for build in character_builds.builds:
         stat_str = ""
-        for stat, value in build["stats"].items():
-            stat_str += f"{cond_text.get_text(str(locale), 'build', stat)} ➜ {str(value).replace('任意', 'ANY')}\n"
+        for stat, value in build.stats.items():
+            stat_str += f"{cond_text.get_text(str(locale), 'build', stat)} ➜ {value.replace('任意', 'ANY')}\n"
         move_text = cond_text.get_text(
-            str(locale), "build", f"{character_name}_{build['move']}"
+            str(locale), "build", f"{character_name}_{build.move}"
         )
-        weapon_id = text_map.get_id_from_name(build["weapon"])
-        if weapon_id is None:
-            raise ValueError(f"Unknown weapon {build['weapon']}")
         embed = default_embed(
             f"{translated_character_name} - {text_map.get(90, locale)}{count}",
-            f"{text_map.get(91, locale)} • {get_weapon_emoji(weapon_id)} {text_map.get_weapon_name(weapon_id, locale)}\n"
-            f"{text_map.get(92, locale)} • {cond_text.get_text(str(locale), 'build', build['artifacts'])}\n"
-            f"{text_map.get(93, locale)} • {translate_main_stat(build['main_stats'], locale)}\n"
-            f"{text_map.get(94, locale)} • {build['talents']}\n"
-            f"{move_text} • {str(build['dmg']).replace('任意', 'ANY')}\n\n",
+            f"{text_map.get(91, locale)} • {get_weapon_emoji(build.weapon_id)} {text_map.get_weapon_name(build.weapon_id, locale)}\n"
+            f"{text_map.get(92, locale)} • {build.artifact_texts[cond_lang]}\n"
+            f"{text_map.get(93, locale)} • {translate_main_stat(build.main_stats, locale)}\n"
+            f"{text_map.get(94, locale)} • {build.talents}\n"
+            f"{move_text} • {build.dmg.replace('任意', 'ANY')}\n\n",
         )
         embed.add_field(name=text_map.get(95, locale), value=stat_str)
         count += 1
@@ -93,16 +90,17 @@ def get_character_builds(
         result.append(
             CharacterBuild(
                 embed=embed,
-                weapon=build["weapon"],
-                artifact=build["artifacts"],
+                weapon=build.weapon,
+                weapon_id=build.weapon_id,
+                artifact=build.artifacts,
                 is_thought=False,
             )
         )
 
-    if "thoughts" in element_builds_dict[character_name]:
+    if character_builds.thoughts:
         count = 1
         embed = default_embed(text_map.get(97, locale))
-        for _ in element_builds_dict[character_name]["thoughts"]:
+        for _ in character_builds.thoughts:
             embed.add_field(
                 name=f"#{count}",
                 value=cond_text.get_text(
@@ -117,20 +115,34 @@ def get_character_builds(
     return result
 
 
+async def reload_game_data() -> Tuple[int, int, int]:
+    """Reload the text maps, the game maps and the build guides from disk without blocking the event loop.
+
+    Returns:
+        Tuple[int, int, int]: The new versions of the text maps, the game maps and the build guides.
+    """
+    loop = asyncio.get_running_loop()
+    text_map_version = await loop.run_in_executor(None, text_map.reload)
+    game_maps = await loop.run_in_executor(None, reload_game_maps)
+    # build guides resolve names with the text map, so they are reloaded after it
+    build_guides = await loop.run_in_executor(None, reload_build_guides)
+    return text_map_version, game_maps.version, build_guides.version
+
+
 def get_character_emoji(id: str) -> str:
-    return character_map.get(id, {}).get("emoji", "")
+    return get_game_maps().character.get(id, {}).get("emoji", "")
 
 
 def get_weapon_emoji(id: int) -> str:
-    return weapon_map.get(str(id), {}).get("emoji", "")
+    return get_game_maps().weapon.get(str(id), {}).get("emoji", "")
 
 
 def get_character_icon(id: str) -> str:
-    return character_map.get(id, {}).get("icon", "")
+    return get_game_maps().character.get(id, {}).get("icon", "")
 
 
 def get_artifact(id: Optional[int] = 0, name: str = ""):
-    for artifact_id, artifact_info in artifact_map.items():
+    for artifact_id, artifact_info in get_game_maps().artifact.items():
         if (
             artifact_id == str(id)
             or name in artifact_info["artifacts"]
@@ -323,39 +335,25 @@ async def get_farm_data(i: discord.Interaction, weekday: int):
     user_locale = await get_user_locale(i.user.id, i.client.db)
     locale = user_locale or i.locale
     ambr = AmbrTopAPI(i.client.session, to_ambr_top(locale))
-    domains = await ambr.get_domain()
-    character_upgrades = await ambr.get_character_upgrade()
-    weapon_upgrades = await ambr.get_weapon_upgrade()
-    if not isinstance(character_upgrades, List) or not isinstance(
-        weapon_upgrades, List
-    ):
-        raise ValueError("Invalid upgrade data")
-    today_domains = []
-    for domain in domains:
-        if domain.weekday == weekday:
-            today_domains.append(domain)
+    today_domains = await ambr.get_domain(weekday)
     for domain in today_domains:
         characters: Dict[str, Character] = {}
         for reward in domain.rewards:
-            for upgrade in character_upgrades:
-                if "10000005" in upgrade.character_id:
+            for character_id in ambr.get_material_users(reward.id).characters:
+                if "10000005" in character_id:
                     continue
-                for item in upgrade.items:
-                    if item.id == reward.id:
-                        character = await ambr.get_character(upgrade.character_id)
-                        if not isinstance(character, Character):
-                            raise ValueError("Invalid character data")
-                        characters[upgrade.character_id] = character
+                character = await ambr.get_character(character_id)
+                if not isinstance(character, Character):
+                    raise ValueError("Invalid character data")
+                characters[character_id] = character
         weapons: Dict[int, Weapon] = {}
         for reward in domain.rewards:
-            for upgrade in weapon_upgrades:
-                for item in upgrade.items:
-                    if item.id == reward.id:
-                        weapon = await ambr.get_weapon(upgrade.weapon_id)
-                        if not isinstance(weapon, Weapon):
-                            raise ValueError("Invalid weapon data")
-                        if not weapon.default_icon:
-                            weapons[upgrade.weapon_id] = weapon
+            for weapon_id in ambr.get_material_users(reward.id).weapons:
+                weapon = await ambr.get_weapon(weapon_id)
+                if not isinstance(weapon, Weapon):
+                    raise ValueError("Invalid weapon data")
+                if not weapon.default_icon:
+                    weapons[weapon_id] = weapon
         # merge two dicts
         items = characters | weapons
         chunks = list(divide_dict(items, 12))
@@ -651,22 +649,11 @@ async def validate_level_input(
         raise InvalidLevelInput
 
 
-async def get_character_suggested_talent_levels(
-    character_id: str, session: aiohttp.ClientSession
-) -> List[int]:
-    chinese_character_name = text_map.get_character_name(character_id, "zh-TW")
-    ambr = AmbrTopAPI(session)
-    character = await ambr.get_character(character_id)
-    if not isinstance(character, Character):
-        return [1, 1, 1]
-    with open(f"data/builds/{character.element.lower()}.yaml") as f:
-        builds = yaml.safe_load(f)
-    character_build = builds.get(chinese_character_name)
-    if character_build is None:
+async def get_character_suggested_talent_levels(character_id: str) -> List[int]:
+    character_builds = get_build_guides().get(character_id)
+    if character_builds is None or not character_builds.builds:
         return [1, 1, 1]
-    talents = builds[chinese_character_name]["builds"][0]["talents"]  # 2/2/2
-    talents = talents.split("/")
-    return [int(talent) for talent in talents]
+    return character_builds.builds[0].talent_levels
 
 
 async def get_enka_data(
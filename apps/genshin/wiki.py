@@ -11,7 +11,6 @@ from ambr.models import (
     Character,
     CharacterDetail,
     CharacterTalentType,
-    CharacterUpgrade,
     FoodDetail,
     FurnitureDetail,
     Material,
@@ -20,7 +19,6 @@ from ambr.models import (
     NameCardDetail,
     Weapon,
     WeaponDetail,
-    WeaponUpgrade,
 )
 from apps.genshin.utils import get_fight_prop
 from apps.text_map.text_map_app import text_map
@@ -266,29 +264,19 @@ async def parse_material_wiki(
             inline=False,
         )
     files = []
-    upgrades = [
-        await client.get_character_upgrade(),
-        await client.get_weapon_upgrade(),
-    ]
-    matches: List[CharacterUpgrade | WeaponUpgrade] = []
-    for upgrade in upgrades:
-        for u in upgrade:
-            material_ids = [m.name for m in u.items]
-            if material.name in material_ids:
-                matches.append(u)
-    if matches:
+    users = client.get_material_users(material.id)
+    if users.characters or users.weapons:
         objects = []
-        for match in matches:
-            if isinstance(match, CharacterUpgrade):
-                character = await client.get_character(match.character_id)
-                if not isinstance(character, Character):
-                    continue
-                objects.append((character, ""))
-            else:
-                weapon = await client.get_weapon(match.weapon_id)
-                if not isinstance(weapon, Weapon):
-                    continue
-                objects.append((weapon, ""))
+        for character_id in users.characters:
+            character = await client.get_character(character_id)
+            if not isinstance(character, Character):
+                continue
+            objects.append((character, ""))
+        for weapon_id in users.weapons:
+            weapon = await client.get_weapon(weapon_id)
+            if not isinstance(weapon, Weapon):
+                continue
+            objects.append((weapon, ""))
         fp = await main_funcs.draw_material_card(
             DrawInput(
                 loop=i.client.loop,
@@ -478,8 +466,9 @@ async def parse_book_wiki(
     book_embed.set_thumbnail(url=book.icon)
     book_embeds: Dict[str, discord.Embed] = {}
     options = [discord.SelectOption(label=book.name, value="book_info")]
+    stories = await client.get_book_stories(book)
     for volume in book.volumes:
-        story = await client.get_book_story(volume.story_id)
+        story = stories[volume.story_id]
         embed = default_embed(volume.name, story)
         embed.set_footer(text=volume.description)
         options.append(discord.SelectOption(label=volume.name, value=str(volume.id)))
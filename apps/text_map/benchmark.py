@@ -0,0 +1,50 @@
+"""Compare TextMap.get with the lookup it replaced.
+
+Usage (from the repository root):
+    python -m apps.text_map.benchmark
+"""
+
+import re
+import timeit
+from typing import Dict
+
+import discord
+
+from apps.text_map.convert_locale import to_paths
+from apps.text_map.text_map_app import text_map
+
+
+def legacy_get(textMapHash: int, locale: discord.Locale | str = "en-US") -> str:
+    """The TextMap.get implementation before the precompiled tables, without the miss logging."""
+    path = to_paths(locale)
+    table: Dict = text_map.text_maps[path]
+    text = table.get(str(textMapHash), "")
+    if text == "":
+        table = text_map.text_maps["en-US"]
+        text = table.get(str(textMapHash), "")
+    if textMapHash != 139:
+        text = re.sub(r"<[^\/][^>]*>", "", text)
+    return text
+
+
+def main() -> None:
+    hashes = [int(h) for h in text_map.text_maps["en-US"]]
+    locales = [discord.Locale.american_english, discord.Locale.taiwan_chinese, "ja", "de"]
+    for locale in locales:
+        for text_hash in hashes:
+            assert legacy_get(text_hash, locale) == text_map.get(text_hash, locale)
+
+    number = 20
+    calls = number * len(hashes) * len(locales)
+    legacy = timeit.timeit(
+        lambda: [legacy_get(h, l) for l in locales for h in hashes], number=number
+    )
+    current = timeit.timeit(
+        lambda: [text_map.get(h, l) for l in locales for h in hashes], number=number
+    )
+    print(f"legacy  {legacy / calls * 1e9:.0f} ns/call")
+    print(f"current {current / calls * 1e9:.0f} ns/call ({legacy / current:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,35 @@
+from time import perf_counter
 from typing import Literal
-import yaml
 
 from apps.text_map.convert_locale import to_paths
+from apps.text_map.yaml_cache import load_yaml
+from utility.utils import log
 
 class CondText:
     def __init__(self):
+        start = perf_counter()
         self.data = {}
         files = ['artifact', 'build', 'character','weapon']
         langs = ['en-US', 'zh-TW']
         for lang in langs:
             for file in files:
-                with open(f"shenhe_external/{lang}/{file}.yaml") as f:
-                    if lang not in self.data:
-                        self.data[lang] = {}
-                    self.data[lang][file] = yaml.safe_load(f)
+                if lang not in self.data:
+                    self.data[lang] = {}
+                self.data[lang][file] = load_yaml(f"shenhe_external/{lang}/{file}.yaml")
+        log.info(f"[Cond Text] Loaded in {perf_counter() - start:.2f}s")
     
-    def get_text(self, lang: str, file: Literal['artifact', 'build', 'character',' weapon'], key: str) -> str:
+    def get_lang(self, lang: str) -> str:
+        """Get the language of the cond texts that are used for a locale."""
         lang = to_paths(lang)
         if lang not in self.data:
             if lang == 'zh-CN':
                 lang = 'zh-TW'
             else:
                 lang = 'en-US'
+        return lang
+
+    def get_text(self, lang: str, file: Literal['artifact', 'build', 'character',' weapon'], key: str) -> str:
+        lang = self.get_lang(lang)
         text = self.data[lang][file].get(key, '')
         if text == '':
             text = self.data['zh-TW'][file].get(key, '')
@@ -1,3 +1,5 @@
+from typing import Dict, NamedTuple, Tuple
+
 from discord import Locale
 
 
@@ -95,29 +97,84 @@ to_hutao_login_dict = {
 }
 
 
+class LocaleInfo(NamedTuple):
+    """A supported locale with the codes every vendor uses for it.
+
+    There is one interned instance per locale, so id can be used to index lists
+    that have an item per locale.
+    """
+
+    id: int
+    key: str
+    """The locale as a string, such as zh-TW"""
+    enka: str
+    ambr_top: str
+    genshin_py: str
+    go: int
+    path: str
+    event_lang: str
+    hutao_login: str
+
+
+LOCALES: Tuple[LocaleInfo, ...] = tuple(
+    LocaleInfo(
+        id=locale_id,
+        key=key,
+        enka=to_enka_dict.get(key) or "en",
+        ambr_top=to_ambr_top_dict.get(key) or "en",
+        genshin_py=to_genshin_py_dict.get(key) or "en-us",
+        go=to_go_dict.get(key) or 4,
+        path=paths.get(key) or "en-US",
+        event_lang=to_event_lang_dict.get(key, "EN"),
+        hutao_login=to_hutao_login_dict.get(key, "en"),
+    )
+    for locale_id, key in enumerate(paths)
+)
+DEFAULT_LOCALE = next(info for info in LOCALES if info.key == "en-US")
+DEFAULT_LOCALE_ID = DEFAULT_LOCALE.id
+
+# every discord.Locale and its string, unsupported locales use en-US like the to_* functions did
+_registry: Dict[Locale | str | LocaleInfo, LocaleInfo] = {}
+for _info in LOCALES:
+    _registry[_info.key] = _info
+    _registry[_info] = _info
+for _locale in Locale:
+    _registry[_locale] = _registry.get(str(_locale), DEFAULT_LOCALE)
+# the same as _registry but to the locale id, for lookups on hot paths
+LOCALE_IDS: Dict[Locale | str | LocaleInfo, int] = {key: info.id for key, info in _registry.items()}
+
+
+def get_locale_info(locale: Locale | str | LocaleInfo) -> LocaleInfo:
+    """Resolve a locale to its interned LocaleInfo, en-US if the locale is not supported."""
+    info = _registry.get(locale)
+    if info is not None:
+        return info
+    return _registry.get(str(locale), DEFAULT_LOCALE)
+
+
 def to_enka(locale: Locale | str):
-    return to_enka_dict.get(str(locale)) or "en"
+    return get_locale_info(locale).enka
 
 
 def to_ambr_top(locale: Locale | str):
-    return to_ambr_top_dict.get(str(locale)) or "en"
+    return get_locale_info(locale).ambr_top
 
 
 def to_genshin_py(locale: Locale | str):
-    return to_genshin_py_dict.get(str(locale)) or "en-us"
+    return get_locale_info(locale).genshin_py
 
 
 def to_go(locale: Locale | str):
-    return to_go_dict.get(str(locale)) or 4
+    return get_locale_info(locale).go
 
 
 def to_paths(locale: Locale | str):
-    return paths.get(str(locale)) or "en-US"
+    return get_locale_info(locale).path
 
 
 def to_event_lang(locale: Locale | str):
-    return to_event_lang_dict.get(str(locale), "EN")
+    return get_locale_info(locale).event_lang
 
 
 def to_hutao_login_lang(locale: Locale | str):
-    return to_hutao_login_dict.get(str(locale), "en")
\ No newline at end of file
+    return get_locale_info(locale).hutao_login
\ No newline at end of file
@@ -0,0 +1,178 @@
+import heapq
+import random
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+# how many results Discord shows in an autocomplete
+MAX_RESULTS = 25
+# longer prefixes are verified against the names instead of being indexed
+MAX_PREFIX = 8
+
+
+class SearchResult(NamedTuple):
+    name: str
+    item_id: str
+    category: str
+    """The text map file the item comes from, such as avatar or weapon"""
+
+
+class LocaleIndex:
+    """The search index of one ambr.top locale.
+
+    Names are sorted by length and then alphabetically, so a smaller position is a
+    better match within the same rank. Each name is indexed by its own prefixes, by
+    the prefixes of its words and by its character unigrams and bigrams, which resolve
+    name starts, word starts and substrings without scanning every name.
+    """
+
+    def __init__(self, entries: List[SearchResult]):
+        self.entries = sorted(entries, key=lambda entry: (len(entry.name), entry.name.casefold()))
+        self.names = [entry.name.casefold() for entry in self.entries]
+        self.starts: Dict[str, Set[int]] = {}
+        self.prefixes: Dict[str, Set[int]] = {}
+        self.grams: Dict[str, Set[int]] = {}
+        for position, name in enumerate(self.names):
+            for end in range(1, min(len(name), MAX_PREFIX) + 1):
+                self.starts.setdefault(name[:end], set()).add(position)
+            for word in name.split():
+                for end in range(1, min(len(word), MAX_PREFIX) + 1):
+                    self.prefixes.setdefault(word[:end], set()).add(position)
+            for start in range(len(name)):
+                self.grams.setdefault(name[start], set()).add(position)
+                if start + 1 < len(name):
+                    self.grams.setdefault(name[start : start + 2], set()).add(position)
+
+    def name_starts_with(self, query: str) -> Set[int]:
+        """Get the positions of the names that start with the query."""
+        positions = self.starts.get(query[:MAX_PREFIX], set())
+        if len(query) > MAX_PREFIX:
+            positions = {p for p in positions if self.names[p].startswith(query)}
+        return positions
+
+    def words_start_with(self, words: List[str]) -> Set[int]:
+        """Get the positions of the names that have a word starting with each of the words."""
+        postings = sorted((self.prefixes.get(word[:MAX_PREFIX], set()) for word in words), key=len)
+        positions = set.intersection(*postings)
+        if any(len(word) > MAX_PREFIX for word in words):
+            positions = {
+                p
+                for p in positions
+                if all(
+                    any(name_word.startswith(word) for name_word in self.names[p].split())
+                    for word in words
+                )
+            }
+        return positions
+
+    def contains(self, query: str, words: List[str]) -> Set[int]:
+        """Get the positions of the names that contain the query or all of its words."""
+        postings = sorted(
+            (
+                self.grams.get(word[start : start + 2], set())
+                for word in words
+                for start in range(max(len(word) - 1, 1))
+            ),
+            key=len,
+        )
+        candidates = set.intersection(*postings)
+        return {
+            p
+            for p in candidates
+            if query in self.names[p] or all(word in self.names[p] for word in words)
+        }
+
+    def search(
+        self, query: str, categories: Optional[Iterable[str]] = None, limit: int = MAX_RESULTS
+    ) -> List[SearchResult]:
+        category_set = set(categories) if categories is not None else None
+        query = " ".join(query.split()).casefold()
+        if not query:
+            entries = self.entries
+            if category_set is not None:
+                entries = [entry for entry in entries if entry.category in category_set]
+            return random.sample(entries, min(limit, len(entries)))
+
+        words = query.split()
+        result: List[int] = []
+        seen: Set[int] = set()
+        # each rank is only computed if the better ranks didn't fill the results
+        for rank in (
+            lambda: self.name_starts_with(query),
+            lambda: self.words_start_with(words),
+            lambda: self.contains(query, words),
+        ):
+            positions = rank() - seen
+            if category_set is not None:
+                positions = {p for p in positions if self.entries[p].category in category_set}
+            result += heapq.nsmallest(limit - len(result), positions)
+            if len(result) >= limit:
+                break
+            seen |= positions
+        return [self.entries[p] for p in result]
+
+
+class SearchIndex:
+    """A ranked search over the item names of text map files.
+
+    The index of every locale is built up front, building it takes long enough that
+    it shouldn't happen on the event loop.
+    """
+
+    def __init__(self, text_maps: Dict[str, Dict[str, Dict[str, str]]]):
+        """
+        Args:
+            text_maps (Dict[str, Dict[str, Dict[str, str]]]): Text map file name to the file's data (item id -> ambr.top locale -> name).
+        """
+        self.text_maps = text_maps
+        ambr_locales = {
+            ambr_locale
+            for text_map in text_maps.values()
+            for names in text_map.values()
+            for ambr_locale in names
+        }
+        self._indexes: Dict[str, LocaleIndex] = {
+            ambr_locale: LocaleIndex(
+                [
+                    SearchResult(names[ambr_locale], item_id, category)
+                    for category, text_map in text_maps.items()
+                    for item_id, names in text_map.items()
+                    if names.get(ambr_locale)
+                ]
+            )
+            for ambr_locale in sorted(ambr_locales)
+        }
+        self._empty = LocaleIndex([])
+
+    def get_index(self, ambr_locale: str) -> LocaleIndex:
+        return self._indexes.get(ambr_locale, self._empty)
+
+    def search(
+        self,
+        query: str,
+        ambr_locale: str,
+        categories: Optional[Iterable[str]] = None,
+        limit: int = MAX_RESULTS,
+    ) -> List[SearchResult]:
+        """Search item names in a locale.
+
+        Results are ranked by exact match, then names starting with the query, then names
+        whose words start with the query's words, then names containing the query or all
+        of its words. Shorter names come first within each group. An empty query returns
+        random items.
+
+        Args:
+            query (str): The query, case and whitespace are ignored.
+            ambr_locale (str): The ambr.top locale of the names.
+            categories (Optional[Iterable[str]], optional): Only search these text map files. Defaults to None.
+            limit (int, optional): The maximum number of results. Defaults to MAX_RESULTS.
+
+        Returns:
+            List[SearchResult]: The results.
+        """
+        return self.get_index(ambr_locale).search(query, categories, limit)
+
+    def find_category(self, item_id: str) -> Optional[str]:
+        """Get the text map file an item id belongs to."""
+        for category, text_map in self.text_maps.items():
+            if item_id in text_map:
+                return category
+        return None
@@ -1,23 +1,118 @@
 import json
 import re
-from typing import Dict, Optional
+import threading
+from collections import Counter
+from time import perf_counter
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import discord
 import yaml
-from apps.text_map.convert_locale import to_ambr_top, to_paths, paths
+from apps.text_map.convert_locale import (DEFAULT_LOCALE_ID, LOCALE_IDS,
+                                          LOCALES, get_locale_info, paths)
+from apps.text_map.search import SearchIndex
+from apps.text_map.yaml_cache import load_yaml
 from utility.utils import log
 
 
-class TextMap:
+TAG_REGEX = re.compile(r"<[^\/][^>]*>")
+# hashes whose text keeps its tags
+RAW_HASHES = (139,)
+
+# text map file name -> item type in the name index
+ITEM_TYPES = {
+    "avatar": "character",
+    "weapon": "weapon",
+    "reliquary": "artifact",
+    "material": "material",
+}
+
+# text map files searched by /search, only used by the search index
+SEARCH_ONLY_FILES = ("monster", "food", "furniture", "namecard", "book")
+
+_reload_lock = threading.Lock()
+
+
+class MissingTranslations:
+    """Counts text map misses so they are reported together instead of logged one by one.
+
+    Misses are keyed by (kind, locale, key), where kind is text, material or artifact,
+    locale is the text map path of the locale, such as en-US, so a discord.Locale and its
+    string are counted together, and key is the hash or id that was not found. The
+    counts are logged and reset by flush, which the schedule cog calls every hour.
+
+    add runs in the executor threads of the draw functions while flush runs on the
+    event loop, so both hold a lock to keep a miss from landing in a Counter that
+    was already swapped out.
+    """
+
     def __init__(self):
+        self.counts: Counter[Tuple[str, str, int | str]] = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, locale: discord.Locale | str, key: int | str) -> None:
+        path = get_locale_info(locale).path
+        with self._lock:
+            self.counts[(kind, path, key)] += 1
+
+    def flush(self, top: int = 20) -> int:
+        """Log the misses counted since the last flush and reset the counts.
+
+        Args:
+            top (int, optional): How many of the most frequent misses to list. Defaults to 20.
+
+        Returns:
+            int: The total number of misses.
+        """
+        with self._lock:
+            counts, self.counts = self.counts, Counter()
+        total = sum(counts.values())
+        if total == 0:
+            return 0
+        most_common = ", ".join(
+            f"[{kind}][{locale}]{key} x{count}"
+            for (kind, locale, key), count in counts.most_common(top)
+        )
+        log.warning(
+            f"[Text Map] {total} misses on {len(counts)} keys since the last report: {most_common}"
+        )
+        return total
+
+
+missing_translations = MissingTranslations()
+
+
+class ItemName(NamedTuple):
+    """An entry of the name index."""
+
+    item_type: str
+    id: int
+    locale: str
+    """The ambr.top locale of the name"""
+    key: str
+    """The key of the item in its text map file, such as 10000005-anemo"""
+
+
+def normalize_name(name: str) -> str:
+    """Casefold a name and collapse its whitespace, used as the key of the name index."""
+    return " ".join(name.split()).casefold()
+
+
+class TextMap:
+    def __init__(self, version: int = 1):
+        self.version = version
+        start = perf_counter()
         langs = paths.values()
         self.text_maps = {}
         for lang in langs:
             try:
-                with open(f"text_maps/langs/{lang}.yaml", "r", encoding="utf-8") as f:
-                    self.text_maps[str(lang)] = yaml.full_load(f)
+                # an empty file loads as None
+                self.text_maps[str(lang)] = (
+                    load_yaml(f"text_maps/langs/{lang}.yaml", yaml.full_load) or {}
+                )
             except FileNotFoundError:
                 self.text_maps[str(lang)] = {}
+        self.build_tables()
+        log.info(f"[Text Map] Loaded {len(self.text_maps)} text maps in {perf_counter() - start:.2f}s")
         try:
             with open("text_maps/avatar.json", "r", encoding="utf-8") as f:
                 self.avatar = json.load(f)
@@ -38,16 +133,122 @@ class TextMap:
                 self.dailyDungeon = json.load(f)
         except FileNotFoundError:
             self.dailyDungeon = {}
-        try:
-            with open("text_maps/item_name.json", "r", encoding="utf-8") as f:
-                self.item_name_text_map = json.load(f)
-        except FileNotFoundError:
-            self.item_name_text_map = {}
         try:
             with open("text_maps/reliquary.json", "r", encoding="utf-8") as f:
                 self.artifact = json.load(f)
         except FileNotFoundError:
             self.artifact = {}
+        search_text_maps = {
+            "avatar": self.avatar,
+            "weapon": self.weapon,
+            "material": self.material,
+            "reliquary": self.artifact,
+        }
+        for file_name in SEARCH_ONLY_FILES:
+            try:
+                with open(f"text_maps/{file_name}.json", "r", encoding="utf-8") as f:
+                    search_text_maps[file_name] = json.load(f)
+            except FileNotFoundError:
+                search_text_maps[file_name] = {}
+        self.build_name_index(search_text_maps)
+        start = perf_counter()
+        self.search_index = SearchIndex(search_text_maps)
+        self.avatar_search_index = SearchIndex({"avatar": self.avatar})
+        log.info(f"[Text Map] Built search indexes in {perf_counter() - start:.2f}s")
+
+    def reload(self) -> int:
+        """Load the text maps from disk and swap them in.
+
+        Everything is loaded into a new TextMap first and its attributes replace this
+        instance's in one assignment, so readers see either the old or the new text maps.
+        Reading and indexing every locale takes seconds, reload_game_data runs it in an executor.
+
+        Returns:
+            int: The version of the new text maps.
+        """
+        with _reload_lock:
+            new_text_map = TextMap(version=self.version + 1)
+            self.__dict__ = new_text_map.__dict__
+        log.info(f"[Text Map] Reloaded (version {self.version})")
+        return self.version
+
+    def build_tables(self) -> None:
+        """Build the lookup tables used by get.
+
+        The tables are keyed by integer hash, the en-US fallback is already applied and
+        tags are already stripped. self.tables is a list indexed by LocaleInfo.id, get
+        looks the tables up through tables_by_key instead.
+        """
+        en_us = self.text_maps.get("en-US", {})
+        tables: Dict[str, Dict[int, str]] = {}
+        for path, text_map in self.text_maps.items():
+            table: Dict[int, str] = {}
+            missing = 0
+            for text_hash in set(text_map) | set(en_us):
+                text = text_map.get(text_hash) or ""
+                if text == "":
+                    missing += 1
+                    text = en_us.get(text_hash) or ""
+                text_hash = int(text_hash)
+                table[text_hash] = text if text_hash in RAW_HASHES else TAG_REGEX.sub("", text)
+            if missing and path != "en-US":
+                log.warning(f"[Text Map][{path}] {missing} hashes fall back to en-US")
+            tables[path] = table
+
+        self.tables: List[Dict[int, str]] = [tables.get(info.path, {}) for info in LOCALES]
+        # every key of the locale registry straight to its table, so get stays a single dict lookup
+        self.tables_by_key = {key: self.tables[i] for key, i in LOCALE_IDS.items()}
+        self.default_table = self.tables[DEFAULT_LOCALE_ID]
+
+    def build_name_index(self, text_maps: Dict[str, Dict[str, Dict[str, str]]]) -> None:
+        """Build the index of normalized item name to the items with that name.
+
+        Characters come first, then weapons, artifacts, materials and the files only
+        /search uses, which is the order find_item prefers when a name is shared by
+        items of different types.
+
+        Args:
+            text_maps (Dict[str, Dict[str, Dict[str, str]]]): Text map file name to the file's data (item id -> ambr.top locale -> name).
+        """
+        self.name_index: Dict[str, List[ItemName]] = {}
+        for file_name in list(ITEM_TYPES) + list(SEARCH_ONLY_FILES):
+            item_type = ITEM_TYPES.get(file_name, file_name)
+            for item_id, names in text_maps.get(file_name, {}).items():
+                # travelers have an id for each element, such as 10000005-anemo
+                int_id = int(str(item_id).split("-")[0])
+                for locale, name in names.items():
+                    if not name:
+                        continue
+                    entries = self.name_index.setdefault(normalize_name(name), [])
+                    entry = ItemName(item_type, int_id, locale, str(item_id))
+                    if entry not in entries:
+                        entries.append(entry)
+
+    def find_item(
+        self,
+        name: str,
+        item_type: Optional[str] = None,
+        locale: Optional[discord.Locale | str] = None,
+    ) -> Optional[ItemName]:
+        """Find an item by its name in any locale.
+
+        Args:
+            name (str): The name of the item, case and whitespace are ignored.
+            item_type (Optional[str], optional): Only find items of this type (character, weapon, artifact, material or a file in SEARCH_ONLY_FILES). Defaults to None.
+            locale (Optional[discord.Locale | str], optional): Prefer a name in this locale. Defaults to None.
+
+        Returns:
+            Optional[ItemName]: The item, None if no item has this name.
+        """
+        entries = self.name_index.get(normalize_name(name), [])
+        if item_type is not None:
+            entries = [entry for entry in entries if entry.item_type == item_type]
+        if locale is not None:
+            ambr_locale = get_locale_info(locale).ambr_top
+            for entry in entries:
+                if entry.locale == ambr_locale:
+                    return entry
+        return entries[0] if entries else None
 
     def get(
         self,
@@ -55,24 +256,28 @@ class TextMap:
         locale: discord.Locale | str = "en-US",
         user_locale: Optional[str] = None,
     ) -> str:
-        locale = user_locale or locale
-        path = to_paths(locale)
-        text_map: Dict = self.text_maps[path]
-        text = text_map.get(str(textMapHash), "")
-        if text == "":
-            log.warning(f"[Text Map][{locale}][Hash not found]: [Hash]{textMapHash}")
-            text_map = self.text_maps["en-US"]
-            text = text_map.get(str(textMapHash), "")
-        if textMapHash != 139:
-            text = re.sub(r"<[^\/][^>]*>", "", text)
+        table = self.tables_by_key.get(user_locale or locale, self.default_table)
+        text = table.get(textMapHash)
+        if text is None:
+            return self._get_missing(table, textMapHash, user_locale or locale)
         return text
 
+    def _get_missing(
+        self, table: Dict[int, str], textMapHash: int | str, locale: discord.Locale | str
+    ) -> str:
+        # hashes are sometimes passed as strings
+        if isinstance(textMapHash, str) and textMapHash.isdigit():
+            text = table.get(int(textMapHash))
+            if text is not None:
+                return text
+        missing_translations.add("text", locale, textMapHash)
+        return ""
+
     def get_id_from_name(self, name: str) -> Optional[int]:
-        result = self.item_name_text_map.get(name)
-        if result is None:
+        item = self.find_item(name)
+        if item is None:
             return None
-        else:
-            return int(result)
+        return item.id
 
     def get_character_name(
         self, character_id: str, locale: discord.Locale | str, user_locale: Optional[str] = None
@@ -81,9 +286,7 @@ class TextMap:
         if avatar_text is None:
             return None
         else:
-            locale = user_locale or locale
-            ambr_locale = to_ambr_top(str(locale))
-            return avatar_text[str(ambr_locale)]
+            return avatar_text[get_locale_info(user_locale or locale).ambr_top]
 
     def get_material_name(
         self, material_id: int, locale: discord.Locale | str, user_locale: Optional[str] = None
@@ -91,20 +294,15 @@ class TextMap:
         material_text = self.material.get(str(material_id))
         if material_text is None:
             if str(material_id).isdigit():
-                log.warning(
-                    f"[Exception][get_material_name][material_id not found]: [material_id]{material_id}"
-                )
+                missing_translations.add("material", user_locale or locale, material_id)
             return material_id
         else:
-            locale = user_locale or locale
-            ambr_locale = to_ambr_top(str(locale))
-            return material_text[str(ambr_locale)]
+            return material_text[get_locale_info(user_locale or locale).ambr_top]
 
     def get_material_id_with_name(self, material_name: str) -> str | int:
-        for material_id, material_name_dict in self.material.items():
-            for _, material_lang_name in material_name_dict.items():
-                if material_lang_name == material_name:
-                    return int(material_id)
+        material = self.find_item(material_name, "material")
+        if material is not None:
+            return material.id
         log.warning(
             f"[Exception][get_material_id_with_name][material_name not found]: [material_name]{material_name}"
         )
@@ -120,9 +318,7 @@ class TextMap:
         if avatarText is None:
             return None
         else:
-            locale = user_locale or locale
-            ambr_locale = to_ambr_top(str(locale))
-            return avatarText[str(ambr_locale)]
+            return avatarText[get_locale_info(user_locale or locale).ambr_top]
 
     def get_domain_name(
         self,
@@ -133,9 +329,8 @@ class TextMap:
         dungeonText = self.dailyDungeon.get(str(dungeon_id))
         if dungeonText is None:
             return str(dungeon_id)
-        locale = user_locale or locale
-        ambr_locale = to_ambr_top(str(locale))
-        return dungeonText.get(str(ambr_locale), str(dungeon_id))
+        ambr_locale = get_locale_info(user_locale or locale).ambr_top
+        return dungeonText.get(ambr_locale, str(dungeon_id))
 
     def get_artifact_name(
         self,
@@ -145,14 +340,10 @@ class TextMap:
     ):
         artifact_text = self.artifact.get(str(artifact_id))
         if artifact_text is None:
-            log.warning(
-                f"[Exception][get_artifact_name][artifact_id not found]: [artifact_id]{artifact_id}"
-            )
+            missing_translations.add("artifact", user_locale or locale, artifact_id)
             return artifact_id
         else:
-            locale = user_locale or locale
-            ambr_locale = to_ambr_top(str(locale))
-            return artifact_text[str(ambr_locale)]
+            return artifact_text[get_locale_info(user_locale or locale).ambr_top]
 
 
 # initialize the class first to load the text maps
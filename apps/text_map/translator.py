@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+from typing import Dict, Optional, Set, Tuple
+
+from discord import Locale, app_commands
+from discord.app_commands import TranslationContext, locale_str
+
+from apps.text_map.convert_locale import get_locale_info
+from apps.text_map.text_map_app import TextMap, text_map
+from utility.utils import log
+
+SYNC_STATE_PATH = "data/cache/command_sync.json"
+
+
+def to_command_text(text: str) -> Optional[str]:
+    """Apply the app command rules to a text: single words are lowercased, empty texts are not translated."""
+    if text == "":
+        return None
+    if len(text.split(" ")) == 1:  # is a word
+        return text.lower()
+    return text  # is a sentence
+
+
+def build_catalog(source: TextMap) -> Dict[Tuple[int, Locale], str]:
+    """Build the translations of every hash in every Discord locale.
+
+    Locales without a text map use the en-US text, as TextMap.get does.
+    """
+    catalog: Dict[Tuple[int, Locale], str] = {}
+    for locale in Locale:
+        table = source.tables[get_locale_info(locale).id]
+        for text_hash, text in table.items():
+            command_text = to_command_text(text)
+            if command_text is not None:
+                catalog[(text_hash, locale)] = command_text
+    return catalog
+
+
+class Translator(app_commands.Translator):
+    """Translates app commands with a catalog built from the text maps.
+
+    The catalog is rebuilt when the text maps are reloaded. The hashes that are
+    translated are recorded, which is how sync_state knows which translations the
+    command tree uses.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.version = text_map.version
+        self.catalog = build_catalog(text_map)
+        self.used_hashes: Set[int] = set()
+
+    async def translate(
+        self, string: locale_str, locale: Locale, context: TranslationContext
+    ) -> Optional[str]:
+        text_hash = string.extras.get("hash")
+        if text_hash is None:
+            return None
+        if self.version != text_map.version:
+            self.version = text_map.version
+            self.catalog = build_catalog(text_map)
+        self.used_hashes.add(text_hash)
+        return self.catalog.get((text_hash, locale))
+
+
+async def sync_state(tree: app_commands.CommandTree, translator: Translator) -> Dict:
+    """Get the state of the command tree that a sync would upload.
+
+    The state is a digest of the untranslated commands plus the catalog entries of
+    every hash the commands use.
+    """
+    commands = tree.get_commands()
+    translator.used_hashes = set()
+    for command in commands:
+        await command.get_translated_payload(translator)
+    payload = json.dumps([command.to_dict() for command in commands], sort_keys=True)
+    return {
+        "commands": hashlib.sha256(payload.encode("utf-8")).hexdigest(),
+        "translations": {
+            f"{text_hash}/{locale.value}": text
+            for (text_hash, locale), text in translator.catalog.items()
+            if text_hash in translator.used_hashes
+        },
+    }
+
+
+def read_sync_state() -> Dict:
+    """Read the state of the command tree at the last sync."""
+    try:
+        with open(SYNC_STATE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def write_sync_state(state: Dict) -> None:
+    os.makedirs(os.path.dirname(SYNC_STATE_PATH), exist_ok=True)
+    with open(f"{SYNC_STATE_PATH}.tmp", "w+", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=4)
+    os.replace(f"{SYNC_STATE_PATH}.tmp", SYNC_STATE_PATH)
+
+
+def diff_sync_state(old: Dict, new: Dict) -> Tuple[bool, Set[str]]:
+    """Compare two sync states.
+
+    Returns:
+        Tuple[bool, Set[str]]: Whether the commands changed, and the "hash/locale" keys of the translations that were added, removed or changed.
+    """
+    old_translations = old.get("translations", {})
+    new_translations = new.get("translations", {})
+    changed = {
+        key
+        for key in old_translations.keys() | new_translations.keys()
+        if old_translations.get(key) != new_translations.get(key)
+    }
+    return old.get("commands") != new.get("commands"), changed
+
+
+async def sync_if_changed(tree: app_commands.CommandTree, force: bool = False) -> bool:
+    """Sync the global command tree unless neither the commands nor their translations changed since the last sync.
+
+    Args:
+        tree (app_commands.CommandTree): The command tree, its translator must be a Translator.
+        force (bool, optional): Sync even if nothing changed. Defaults to False.
+
+    Returns:
+        bool: Whether the tree was synced.
+    """
+    translator = tree.translator
+    if not isinstance(translator, Translator):
+        await tree.sync()
+        return True
+    state = await sync_state(tree, translator)
+    commands_changed, translations_changed = diff_sync_state(read_sync_state(), state)
+    if not force and not commands_changed and not translations_changed:
+        log.info("[Translator] Commands and translations unchanged, skipping sync")
+        return False
+    await tree.sync()
+    write_sync_state(state)
+    log.info(
+        f"[Translator] Synced (commands changed: {commands_changed}) "
+        f"(translations changed: {len(translations_changed)})"
+    )
+    return True
@@ -0,0 +1,71 @@
+import hashlib
+import marshal
+import os
+import sys
+from typing import Any, Callable, Dict
+
+import yaml
+
+from utility.utils import log
+
+SNAPSHOT_PATH = "data/cache/yaml_snapshots"
+
+
+def snapshot_path(path: str) -> str:
+    """Get the path of the compiled snapshot of a YAML file.
+
+    The marshal format depends on the Python version, so it is part of the file name.
+    """
+    name = path.replace("/", "_").replace("\\", "_")
+    version = f"py{sys.version_info[0]}{sys.version_info[1]}m{marshal.version}"
+    return f"{SNAPSHOT_PATH}/{name}.{version}.marshal"
+
+
+def load_yaml(path: str, loader: Callable[[Any], Any] = yaml.safe_load) -> Any:
+    """Load a YAML file, using a compiled snapshot if the file hasn't changed.
+
+    The snapshot is used if the file's mtime is unchanged, or if the mtime changed
+    but the SHA-256 of its content didn't. Otherwise the file is parsed with loader
+    and a new snapshot is written.
+
+    Args:
+        path (str): The path of the YAML file.
+        loader (Callable[[Any], Any], optional): The YAML loader. Defaults to yaml.safe_load.
+
+    Raises:
+        FileNotFoundError: If the YAML file doesn't exist.
+
+    Returns:
+        Any: The parsed data.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    snapshot: Dict[str, Any] = {}
+    try:
+        with open(snapshot_path(path), "rb") as f:
+            snapshot = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        pass
+    if snapshot.get("mtime") == mtime:
+        return snapshot["data"]
+
+    with open(path, "rb") as f:
+        content = f.read()
+    content_hash = hashlib.sha256(content).hexdigest()
+    if snapshot.get("hash") == content_hash:
+        data = snapshot["data"]
+    else:
+        data = loader(content.decode("utf-8"))
+    try:
+        write_snapshot(path, {"mtime": mtime, "hash": content_hash, "data": data})
+    except (OSError, ValueError) as e:
+        # ValueError: data has a type that marshal doesn't support
+        log.warning(f"[YAML Cache] Failed to write snapshot of {path}: {e}")
+    return data
+
+
+def write_snapshot(path: str, snapshot: Dict[str, Any]) -> None:
+    os.makedirs(SNAPSHOT_PATH, exist_ok=True)
+    file_path = snapshot_path(path)
+    with open(f"{file_path}.tmp", "wb") as f:
+        marshal.dump(snapshot, f)
+    os.replace(f"{file_path}.tmp", file_path)
@@ -10,6 +10,8 @@ from discord.app_commands import locale_str as _
 from discord.ext import commands
 
 from apps.genshin.custom_model import ShenheBot
+from apps.genshin.utils import reload_game_data
+from apps.text_map.translator import sync_if_changed
 from utility.utils import error_embed
 
 
@@ -86,12 +88,25 @@ class AdminCog(commands.Cog, name="admin"):
                 )
         await i.edit_original_response(content="reloaded cogs")
 
+    @is_seria()
+    @app_commands.command(
+        name="reload-data", description=_("Owner usage only", hash=496)
+    )
+    async def reload_data(self, i: Interaction):
+        await i.response.defer(ephemeral=True)
+        text_map_version, game_maps_version, build_guides_version = await reload_game_data()
+        await i.followup.send(
+            f"reloaded text map (version {text_map_version}), game maps (version {game_maps_version}) "
+            f"and build guides (version {build_guides_version})",
+            ephemeral=True,
+        )
+
     @is_seria()
     @app_commands.command(name="sync", description=_("Owner usage only", hash=496))
-    async def roles(self, i: Interaction):
+    async def roles(self, i: Interaction, force: bool = False):
         await i.response.defer()
-        await self.bot.tree.sync()
-        await i.followup.send("sync done")
+        synced = await sync_if_changed(self.bot.tree, force)
+        await i.followup.send("sync done" if synced else "nothing changed, sync skipped")
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -1,5 +1,3 @@
-import json
-import random
 from datetime import datetime, timedelta
 from typing import List, Tuple
 
@@ -87,30 +85,6 @@ class GenshinCog(commands.Cog, name="genshin"):
         self.bot: ShenheBot = bot
         self.genshin_app = GenshinApp(self.bot.db, self.bot)
         self.debug = self.bot.debug
-        maps_to_open = [
-            "avatar",
-            "weapon",
-            "material",
-            "reliquary",
-            "monster",
-            "food",
-            "furniture",
-            "namecard",
-            "book",
-        ]
-        self.text_map_files = []
-        for m in maps_to_open:
-            try:
-                with open(f"text_maps/{m}.json", "r", encoding="utf-8") as f:
-                    data = json.load(f)
-            except FileNotFoundError:
-                data = {}
-            self.text_map_files.append(data)
-        try:
-            with open(f"text_maps/item_name.json", "r", encoding="utf-8") as f:
-                self.item_names = json.load(f)
-        except FileNotFoundError:
-            self.item_names = {}
 
         # Right click commands
         self.search_uid_context_menu = app_commands.ContextMenu(
@@ -738,68 +712,62 @@ class GenshinCog(commands.Cog, name="genshin"):
             ambr_top_locale = to_ambr_top(locale)
             client = AmbrTopAPI(self.bot.session, ambr_top_locale)
             if not query.isdigit():
-                query = (
-                    self.item_names.get(query)
-                    or self.item_names.get(query.title())
-                    or query
-                )
-            item_type = None
-            for index, file in enumerate(self.text_map_files):
-                if query in file:
-                    item_type = index
-                    break
+                item = text_map.find_item(query)
+                if item is not None:
+                    query = item.key
+            item_type = text_map.search_index.find_category(query)
             if item_type is None:
                 raise ItemNotFound
 
-            if item_type == 0:  # character
+            if item_type == "avatar":  # character
                 character = await client.get_character_detail(query)
                 if character is None:
                     raise ItemNotFound
                 await parse_character_wiki(character, i, locale, client, dark_mode)
 
-            elif item_type == 1:  # weapon
+            elif item_type == "weapon":
                 weapon = await client.get_weapon_detail(int(query))
                 if weapon is None:
                     raise ItemNotFound
                 await parse_weapon_wiki(weapon, i, locale, client, dark_mode)
 
-            elif item_type == 2:  # material
+            elif item_type == "material":
                 material = await client.get_material_detail(int(query))
                 if material is None:
                     raise ItemNotFound
                 await parse_material_wiki(material, i, locale, client, dark_mode)
 
-            elif item_type == 3:  # artifact
+            elif item_type == "reliquary":  # artifact
                 artifact = await client.get_artifact_detail(int(query))
                 if artifact is None:
                     raise ItemNotFound
                 await parse_artifact_wiki(artifact, i, locale)
 
-            elif item_type == 4:  # monster
+            elif item_type == "monster":
                 monster = await client.get_monster_detail(int(query))
                 if monster is None:
                     raise ItemNotFound
                 await parse_monster_wiki(monster, i, locale, client, dark_mode)
 
-            elif item_type == 5:  # food
+            elif item_type == "food":
                 food = await client.get_food_detail(int(query))
                 if food is None:
                     raise ItemNotFound
                 await parse_food_wiki(food, i, locale, client, dark_mode)
 
-            elif item_type == 6:  # furniture
+            elif item_type == "furniture":
                 furniture = await client.get_furniture_detail(int(query))
                 if furniture is None:
                     raise ItemNotFound
                 await parse_furniture_wiki(furniture, i, locale, client, dark_mode)
 
-            elif item_type == 7:  # namecard
+            elif item_type == "namecard":
                 namecard = await client.get_name_card_detail(int(query))
                 if namecard is None:
                     raise ItemNotFound
                 await parse_namecard_wiki(namecard, i, locale)
 
-            elif item_type == 8:  # book
+            elif item_type == "book":
                 book = await client.get_book_detail(int(query))
                 if book is None:
                     raise ItemNotFound
@@ -820,24 +788,10 @@ class GenshinCog(commands.Cog, name="genshin"):
     ) -> List[Choice[str]]:
         user_locale = await get_user_locale(i.user.id, self.bot.db)
         ambr_top_locale = to_ambr_top(user_locale or i.locale)
-        result = []
-        for queries in self.text_map_files:
-            for item_id, query_names in queries.items():
-                item_name = query_names[ambr_top_locale]
-                if current.lower() in item_name.lower() and item_name != "":
-                    result.append(Choice(name=item_name, value=item_id))
-                elif " " in current:
-                    splited = current.split(" ")
-                    all_match = True
-                    for word in splited:
-                        if word.lower() not in item_name.lower():
-                            all_match = False
-                            break
-                    if all_match and item_name != "":
-                        result.append(Choice(name=item_name, value=item_id))
-        if current == "":
-            random.shuffle(result)
-        return result[:25]
+        return [
+            Choice(name=result.name, value=result.item_id)
+            for result in text_map.search_index.search(current, ambr_top_locale)
+        ]
 
     @check_account()
     @app_commands.command(
@@ -1,4 +1,3 @@
-import json
 import os
 import sys
 from datetime import datetime
@@ -27,11 +26,6 @@ load_dotenv()
 class OthersCog(commands.Cog, name="others"):
     def __init__(self, bot):
         self.bot: ShenheBot = bot
-        try:
-            with open(f"text_maps/avatar.json", "r", encoding="utf-8") as f:
-                self.avatar = json.load(f)
-        except FileNotFoundError:
-            self.avatar = {}
 
     @app_commands.command(
         name="settings",
@@ -221,15 +215,10 @@ class OthersCog(commands.Cog, name="others"):
     @custom_image_upload.autocomplete(name="character_id")
     async def custom_image_upload_autocomplete(self, i: Interaction, current: str):
         locale = await get_user_locale(i.user.id, self.bot.db) or i.locale
-        options = []
-        for character_id, character_names in self.avatar.items():
-            if current.lower() in character_names[to_ambr_top(locale)].lower():
-                options.append(
-                    Choice(
-                        name=character_names[to_ambr_top(locale)], value=character_id
-                    )
-                )
-        return options[:25]
+        return [
+            Choice(name=result.name, value=result.item_id)
+            for result in text_map.avatar_search_index.search(current, to_ambr_top(locale))
+        ]
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -3,7 +3,7 @@ import asyncio
 import json
 import random
 from datetime import datetime, timedelta
-from time import process_time
+from time import perf_counter, process_time
 import traceback
 from typing import List, Literal, Optional
 from apps.draw import main_funcs
@@ -18,10 +18,14 @@ from discord.utils import find, format_dt
 import asset
 from ambr.client import AmbrTopAPI
 from ambr.models import Artifact, Character, Domain, Material, Weapon
+from ambr.snapshot import get_snapshot
+from apps.draw.font_cache import font_cache
+from apps.draw.icon_cache import icon_cache
+from apps.draw.templates import template_cache
 from apps.genshin.custom_model import DrawInput, NotificationUser, ShenheBot, ShenheUser
-from apps.genshin.utils import get_shenhe_user, get_uid, get_uid_tz
+from apps.genshin.utils import get_shenhe_user, get_uid, get_uid_tz, reload_game_data
 from apps.text_map.convert_locale import to_ambr_top, to_ambr_top_dict
-from apps.text_map.text_map_app import text_map
+from apps.text_map.text_map_app import missing_translations, text_map
 from apps.text_map.utils import get_user_locale
 from cogs.admin import is_seria
 from utility.utils import default_embed, error_embed, get_dt_now, get_user_appearance_mode, log
@@ -74,6 +78,7 @@ class Schedule(commands.Cog):
             await asyncio.create_task(self.update_ambr_cache())
             await asyncio.create_task(self.update_text_map())
             await asyncio.create_task(self.update_game_data())
+            await asyncio.create_task(self.reload_data())
             await asyncio.create_task(self.backup_database())
 
         if now.hour in [4, 15, 21] and now.minute < self.loop_interval:  # 4am, 3pm, 9pm
@@ -97,6 +102,11 @@ class Schedule(commands.Cog):
             await asyncio.create_task(self.base_notification("resin_notification"))
             await asyncio.create_task(self.base_notification("pot_notification"))
             await asyncio.create_task(self.base_notification("pt_notification"))
+            missing_translations.flush()
+            font_cache.report()
+            template_cache.report()
+            icon_cache.report()
+            get_snapshot().report()
 
     @tasks.loop(minutes=20)
     async def change_status(self):
@@ -490,7 +500,6 @@ class Schedule(commands.Cog):
                 now = get_dt_now() + timedelta(hours=time_offset)
                 locale = await get_user_locale(user_id, self.bot.db) or "en-US"
                 client = AmbrTopAPI(self.bot.session, to_ambr_top(locale))
-                domains = await client.get_domain()
                 user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
                 uid = await get_uid(user_id, self.bot.db)
                 uid_tz = get_uid_tz(uid)
@@ -498,21 +507,17 @@ class Schedule(commands.Cog):
                     continue
                 item_list = ast.literal_eval(item_list)
                 notified = {}
-                today_domains = [d for d in domains if d.weekday == now.weekday()]
+                today_domains = await client.get_domain(now.weekday())
                 for item_id in item_list:
                     for domain in today_domains:
                         for reward in domain.rewards:
+                            users = client.get_material_users(reward.id)
                             if notification_type == "talent_notification":
-                                upgrade = await client.get_character_upgrade(
-                                    str(item_id)
-                                )
+                                uses_reward = str(item_id) in users.characters
                             else:
-                                upgrade = await client.get_weapon_upgrade(int(item_id))
-
-                            if upgrade is None or isinstance(upgrade, List):
-                                continue
+                                uses_reward = int(item_id) in users.weapons
 
-                            if reward in upgrade.items:
+                            if uses_reward:
                                 if item_id not in notified:
                                     notified[item_id] = {
                                         "materials": [],
@@ -692,9 +697,10 @@ class Schedule(commands.Cog):
         log.info("[Schedule][Update Game Data] Ended")
 
     @schedule_error_handler
-    async def update_text_map(self):
+    async def update_text_map(self, concurrency: int = 8):
         """Updates genshin text map"""
         log.info("[Schedule][Update Text Map] Start")
+        start = perf_counter()
         # character, weapon, material, artifact text map
         things_to_update = [
             "avatar",
@@ -707,76 +713,112 @@ class Schedule(commands.Cog):
             "monster",
             "namecard",
         ]
-        for thing in things_to_update:
-            dict = {}
-            for lang in list(to_ambr_top_dict.values()):
+        langs = list(to_ambr_top_dict.values())
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(lang: str, endpoint: str) -> dict:
+            async with semaphore:
                 async with self.bot.session.get(
-                    f"https://api.ambr.top/v2/{lang}/{thing}"
+                    f"https://api.ambr.top/v2/{lang}/{endpoint}"
                 ) as r:
-                    data = await r.json()
-                for character_id, character_info in data["data"]["items"].items():
-                    if character_id not in dict:
-                        dict[character_id] = {}
-                    dict[character_id][lang] = character_info["name"]
-            if thing == "avatar":
-                dict["10000007"] = {
-                    "chs": "旅行者",
-                    "cht": "旅行者",
-                    "de": "Reisende",
-                    "en": "Traveler",
-                    "es": "Viajera",
-                    "fr": "Voyageuse",
-                    "jp": "旅人",
-                    "kr": "여행자",
-                    "th": "นักเดินทาง",
-                    "pt": "Viajante",
-                    "ru": "Путешественница",
-                    "vi": "Nhà Lữ Hành",
-                }
-                dict["10000005"] = dict["10000007"]
+                    return await r.json()
+
+        requests = [
+            (thing, lang) for thing in things_to_update + ["dailyDungeon"] for lang in langs
+        ]
+        responses = await asyncio.gather(
+            *(fetch(lang, thing) for thing, lang in requests)
+        )
+
+        text_maps = {thing: {} for thing in things_to_update + ["dailyDungeon"]}
+        for (thing, lang), data in zip(requests, responses):
+            if thing == "dailyDungeon":
+                for _, domains in data["data"].items():
+                    for _, domain_info in domains.items():
+                        text_maps[thing].setdefault(str(domain_info["id"]), {})[
+                            lang
+                        ] = domain_info["name"]
+            else:
+                for item_id, item_info in data["data"]["items"].items():
+                    text_maps[thing].setdefault(item_id, {})[lang] = item_info["name"]
+        text_maps["avatar"]["10000007"] = {
+            "chs": "旅行者",
+            "cht": "旅行者",
+            "de": "Reisende",
+            "en": "Traveler",
+            "es": "Viajera",
+            "fr": "Voyageuse",
+            "jp": "旅人",
+            "kr": "여행자",
+            "th": "นักเดินทาง",
+            "pt": "Viajante",
+            "ru": "Путешественница",
+            "vi": "Nhà Lữ Hành",
+        }
+        text_maps["avatar"]["10000005"] = text_maps["avatar"]["10000007"]
+
+        changed = []
+        for thing, new_map in text_maps.items():
+            try:
+                with open(f"text_maps/{thing}.json", "r", encoding="utf-8") as f:
+                    old_map = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                old_map = {}
+            if old_map == new_map:
+                continue
+            changed.append(thing)
             with open(f"text_maps/{thing}.json", "w+", encoding="utf-8") as f:
-                json.dump(dict, f, indent=4, ensure_ascii=False)
-
-        # daily dungeon text map
-        dict = {}
-        for lang in list(to_ambr_top_dict.values()):
-            async with self.bot.session.get(
-                f"https://api.ambr.top/v2/{lang}/dailyDungeon"
-            ) as r:
-                data = await r.json()
-            for _, domains in data["data"].items():
-                for _, domain_info in domains.items():
-                    if str(domain_info["id"]) not in dict:
-                        dict[str(domain_info["id"])] = {}
-                    dict[str(domain_info["id"])][lang] = domain_info["name"]
-        with open(f"text_maps/dailyDungeon.json", "w+", encoding="utf-8") as f:
-            json.dump(dict, f, indent=4, ensure_ascii=False)
-
-        # item name text map
-        huge_text_map = {}
-        for thing in things_to_update:
-            with open(f"text_maps/{thing}.json", "r", encoding="utf-8") as f:
-                text_map = json.load(f)
-            for item_id, item_info in text_map.items():
-                for lang, name in item_info.items():
-                    if "10000005" in item_id:
-                        huge_text_map[name] = "10000005"
-                    elif "10000007" in item_id:
-                        huge_text_map[name] = "10000007"
-                    else:
-                        huge_text_map[name] = item_id
-        with open(f"text_maps/item_name.json", "w+", encoding="utf-8") as f:
-            json.dump(huge_text_map, f, indent=4, ensure_ascii=False)
-        log.info("[Schedule][Update Text Map] Ended")
+                json.dump(new_map, f, indent=4, ensure_ascii=False)
+            added = [item_id for item_id in new_map if item_id not in old_map]
+            removed = [item_id for item_id in old_map if item_id not in new_map]
+            renamed = [
+                item_id
+                for item_id in new_map
+                if item_id in old_map and new_map[item_id] != old_map[item_id]
+            ]
+            log.info(
+                f"[Schedule][Update Text Map][{thing}] "
+                f"added: {', '.join(added) or 'none'} | "
+                f"removed: {', '.join(removed) or 'none'} | "
+                f"renamed: {', '.join(renamed) or 'none'}"
+            )
+        log.info(
+            f"[Schedule][Update Text Map] Ended in {perf_counter() - start:.2f}s "
+            f"(changed: {', '.join(changed) or 'none'})"
+        )
 
     @schedule_error_handler
     async def update_ambr_cache(self):
         """Updates data from ambr.top"""
         log.info("[Schedule][Update Ambr Cache] Start")
+        start = perf_counter()
         client = AmbrTopAPI(self.bot.session)
-        await client.update_cache(all_lang=True)
-        await client.update_cache(static=True)
-        log.info("[Schedule][Update Ambr Cache] Ended")
+        results = await client.update_cache(all_lang=True)
+        results += await client.update_cache(static=True)
+        for result in results:
+            if result.error is not None:
+                log.warning(
+                    f"[Schedule][Update Ambr Cache] {result.endpoint} failed: {result.error}"
+                )
+        changed = [result.endpoint for result in results if result.changed]
+        slowest = max(results, key=lambda result: result.time)
+        log.info(
+            f"[Schedule][Update Ambr Cache] Ended in {perf_counter() - start:.2f}s "
+            f"(changed: {', '.join(changed) or 'none'}) "
+            f"(slowest: {slowest.endpoint} {slowest.time:.2f}s)"
+        )
+
+    @schedule_error_handler
+    async def reload_data(self):
+        """Swaps in the text maps and game data written by update_text_map and update_game_data"""
+        log.info("[Schedule][Reload Data] Start")
+        start = perf_counter()
+        text_map_version, game_maps_version, build_guides_version = await reload_game_data()
+        log.info(
+            f"[Schedule][Reload Data] Ended in {perf_counter() - start:.2f}s "
+            f"(text map version {text_map_version}, game maps version {game_maps_version}, "
+            f"build guides version {build_guides_version})"
+        )
 
     @run_tasks.before_loop
     async def before_run_tasks(self):
@@ -795,6 +837,7 @@ class Schedule(commands.Cog):
         await asyncio.create_task(self.update_ambr_cache())
         await asyncio.create_task(self.update_text_map())
         await asyncio.create_task(self.update_game_data())
+        await asyncio.create_task(self.reload_data())
         await i.followup.send("Tasks started", ephemeral=True)
 
 
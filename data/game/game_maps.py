@@ -0,0 +1,50 @@
+import json
+from typing import Dict, NamedTuple
+
+from utility.reloadable import Reloadable
+
+
+class GameMaps(NamedTuple):
+    """The character, weapon and artifact maps under data/game, loaded together."""
+
+    version: int
+    character: Dict[str, Dict]
+    weapon: Dict[str, Dict]
+    artifact: Dict[str, Dict]
+
+
+def load_map(name: str) -> Dict[str, Dict]:
+    try:
+        with open(f"data/game/{name}_map.json", encoding="utf-8", mode="r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def load_game_maps(version: int) -> GameMaps:
+    return GameMaps(
+        version=version,
+        character=load_map("character"),
+        weapon=load_map("weapon"),
+        artifact=load_map("artifact"),
+    )
+
+
+_game_maps: Reloadable[GameMaps] = Reloadable(lambda version, _: load_game_maps(version))
+
+
+def get_game_maps() -> GameMaps:
+    """Get the current game maps, loading them on first use.
+
+    Keep a reference to the returned tuple instead of calling this again when
+    reading several maps, so they all come from the same version.
+    """
+    return _game_maps.get()
+
+
+def reload_game_maps() -> GameMaps:
+    """Read the map files under data/game again and swap them in together.
+
+    The files are parsed on the calling thread, reload_game_data calls this from an executor.
+    """
+    return _game_maps.reload()
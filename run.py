@@ -6,15 +6,15 @@ from datetime import datetime
 import getpass
 import os
 from pathlib import Path
-from typing import Optional
 import aiohttp
 import aiosqlite
+from apps.draw.templates import warm_templates
+from apps.draw.utility import warm_font_cache
 from apps.genshin.browser import launch_browsers
 import genshin
 import sentry_sdk
 from cachetools import TTLCache
-from discord import Intents, Interaction, Locale, Message, app_commands
-from discord.app_commands import TranslationContext, locale_str
+from discord import Intents, Interaction, Message, app_commands
 from discord.ext import commands
 from discord.ext.commands import Context
 from dotenv import load_dotenv
@@ -28,6 +28,7 @@ from logingateway.model import Player, Ready, LoginMethod
 from UI_elements.others.ManageAccounts import return_accounts
 
 from apps.text_map.text_map_app import text_map
+from apps.text_map.translator import Translator
 from UI_base_models import global_error_handler
 from utility.utils import default_embed, error_embed, log, sentry_logging
 
@@ -49,22 +50,6 @@ intents = Intents.default()
 intents.members = True
 
 
-class Translator(app_commands.Translator):
-    async def translate(
-        self, string: locale_str, locale: Locale, context: TranslationContext
-    ) -> Optional[str]:
-        try:
-            text = text_map.get(string.extras["hash"], locale)
-            if text == "":
-                return None
-            if len(text.split(" ")) == 1:  # is a word
-                return text.lower()
-            else:  # is a setence
-                return text
-        except KeyError:
-            return None
-
-
 class Shenhe(commands.Bot):
     def __init__(self):
         super().__init__(
@@ -117,6 +102,10 @@ class Shenhe(commands.Bot):
             cookie_list.append(cookie)
         self.genshin_client = genshin.Client(cookie_list)
 
+        await asyncio.get_running_loop().run_in_executor(None, warm_font_cache)
+        if not self.debug:
+            await asyncio.get_running_loop().run_in_executor(None, warm_templates)
+
         # load jishaku
         await self.load_extension("jishaku")
 
@@ -0,0 +1,102 @@
+import threading
+from typing import Callable, Generic, Hashable, List, NamedTuple, Optional, TypeVar
+
+from cachetools import LRUCache
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    misses: int
+    entries: int
+    size: int
+    """The size of the entries as measured by the cache's getsizeof, the number of entries without one"""
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def describe_hits(self) -> str:
+        return f"hit rate {self.hit_rate:.1%} ({self.hits} hits, {self.misses} misses)"
+
+
+class LoadingCache(Generic[K, V]):
+    """A thread-safe LRU cache that loads missing values and counts its hits and misses.
+
+    Values are loaded outside of the lock, so a slow load doesn't block other threads,
+    at the cost of two threads sometimes loading the same value at once. The value
+    stored first is kept and returned to both. Values larger than the whole cache
+    are returned without being stored.
+    """
+
+    def __init__(self, maxsize: int, getsizeof: Optional[Callable[[V], int]] = None):
+        self._cache: LRUCache[K, V] = LRUCache(maxsize=maxsize, getsizeof=getsizeof)
+        self._getsizeof = getsizeof
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return int(self._cache.maxsize)
+
+    def get(self, key: K, load: Callable[[], V]) -> V:
+        """Get a value, loading and storing it if it isn't cached.
+
+        Args:
+            key (K): The key of the value.
+            load (Callable[[], V]): Loads the value, exceptions are raised to the caller and nothing is cached.
+
+        Returns:
+            V: The value.
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+            self.misses += 1
+        value = load()
+        if self._getsizeof is not None and self._getsizeof(value) > self._cache.maxsize:
+            return value
+        with self._lock:
+            return self._cache.setdefault(key, value)
+
+    def __contains__(self, key: K) -> bool:
+        with self._lock:
+            return key in self._cache
+
+    def keys(self) -> List[K]:
+        with self._lock:
+            return list(self._cache.keys())
+
+    def discard(self, predicate: Callable[[K], bool]) -> int:
+        """Remove the values whose key matches a predicate.
+
+        Returns:
+            int: The number of values removed.
+        """
+        with self._lock:
+            keys = [key for key in self._cache.keys() if predicate(key)]
+            for key in keys:
+                del self._cache[key]
+        return len(keys)
+
+    def stats(self, reset: bool = False) -> CacheStats:
+        """Get the cache stats.
+
+        Args:
+            reset (bool, optional): Reset the hit and miss counts, for stats that are reported periodically. Defaults to False.
+
+        Returns:
+            CacheStats: The stats.
+        """
+        with self._lock:
+            stats = CacheStats(self.hits, self.misses, len(self._cache), int(self._cache.currsize))
+            if reset:
+                self.hits = 0
+                self.misses = 0
+        return stats
@@ -0,0 +1,51 @@
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class Reloadable(Generic[T]):
+    """A process-wide value that is built on first use and replaced as a whole by reload.
+
+    Readers get the current value without taking the lock, and a reload builds the new
+    value before it is swapped in, so a reader never sees a partly built value. Values
+    are numbered starting from 1, every reload builds the next version. When reloads
+    overlap, a slower reload never replaces the value of a newer one.
+
+    Args:
+        build (Callable[[int, Optional[T]], T]): Builds a value from its version and the value it replaces, None for the first one.
+    """
+
+    def __init__(self, build: Callable[[int, Optional[T]], T]):
+        self._build = build
+        self._value: Optional[T] = None
+        self._version = 0
+        self._last_version = 0
+        self._lock = threading.Lock()
+
+    def _next_version(self) -> int:
+        with self._lock:
+            self._last_version += 1
+            return self._last_version
+
+    def get(self) -> T:
+        """Get the current value, building the first one if there is none yet."""
+        value = self._value
+        if value is not None:
+            return value
+        with self._lock:
+            if self._value is None:
+                self._last_version += 1
+                self._value = self._build(self._last_version, None)
+                self._version = self._last_version
+            return self._value
+
+    def reload(self) -> T:
+        """Build the next version of the value and swap it in."""
+        version = self._next_version()
+        value = self._build(version, self._value)
+        with self._lock:
+            if version > self._version:
+                self._value = value
+                self._version = version
+        return value